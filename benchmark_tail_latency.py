@@ -0,0 +1,155 @@
+"""
+🐸 Pepe Bot Slack API 꼬리 지연 벤치마크
+
+실제 Slack에 요청하지 않고 requests.get에 인위적인 지연을 주입하여,
+헤지 요청과 회로 차단기가 p99 응답 시간에 주는 영향을 측정합니다.
+
+사용법:
+    python benchmark_tail_latency.py [--requests 600] [--concurrency 8]
+"""
+
+import os
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable
+
+import requests
+
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ["SLACK_CACHE_SNAPSHOT"] = ""
+
+import slack_api  # noqa: E402
+from slack_api import SlackAPIClient, CircuitBreaker  # noqa: E402
+
+
+class FakeResponse:
+    """
+    지연 주입용 가짜 HTTP 응답
+    """
+
+    status_code: int = 200
+    headers: Dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        """
+        항상 성공합니다.
+        """
+
+    def json(self) -> Dict[str, Any]:
+        """
+        users.info 성공 응답을 반환합니다.
+        """
+        return {"ok": True, "user": {"id": "U0000000001", "real_name": "Pepe"}}
+
+
+def injected_get(slow_ratio: float, hang_ratio: float) -> Callable[..., FakeResponse]:
+    """
+    지연이 주입된 requests.get 대체 함수를 만듭니다.
+
+    Args:
+        slow_ratio (float): 느린 응답(300~800ms) 비율
+        hang_ratio (float): 타임아웃까지 멈추는 응답 비율
+
+    Returns:
+        Callable[..., FakeResponse]: requests.get 대체 함수
+    """
+    rng: random.Random = random.Random(42)
+    rng_lock: threading.Lock = threading.Lock()
+
+    def fake_get(url: str, timeout: float = 10.0, **kwargs: Any) -> FakeResponse:
+        with rng_lock:
+            roll: float = rng.random()
+            delay: float = rng.uniform(0.01, 0.03)
+            if roll < hang_ratio:
+                delay = float("inf")
+            elif roll < hang_ratio + slow_ratio:
+                delay = rng.uniform(0.3, 0.8)
+
+        if delay >= timeout:
+            time.sleep(timeout)
+            raise requests.Timeout(f"Read timed out. (read timeout={timeout})")
+        time.sleep(delay)
+        return FakeResponse()
+
+    return fake_get
+
+
+def run_load(client: SlackAPIClient, total: int, concurrency: int) -> List[float]:
+    """
+    users.info 요청을 동시에 보내고 각 요청의 응답 시간을 측정합니다.
+
+    Args:
+        client (SlackAPIClient): 측정할 클라이언트
+        total (int): 총 요청 수
+        concurrency (int): 동시 요청 수
+
+    Returns:
+        List[float]: 요청별 응답 시간 (초)
+    """
+    def one_call(index: int) -> float:
+        started_at: float = time.monotonic()
+        with client.deadline(2.0):
+            client.make_request("users.info", data={"user": f"U{index % 50:010d}"})
+        return time.monotonic() - started_at
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(one_call, range(total)))
+
+
+def summarize(name: str, latencies: List[float]) -> None:
+    """
+    응답 시간 분포를 출력합니다.
+
+    Args:
+        name (str): 시나리오 이름
+        latencies (List[float]): 요청별 응답 시간 (초)
+    """
+    ordered: List[float] = sorted(latencies)
+
+    def pct(percentile: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))] * 1000
+
+    print(f"{name:<36} p50={pct(50):7.1f}ms  p95={pct(95):7.1f}ms  p99={pct(99):7.1f}ms  max={ordered[-1] * 1000:7.1f}ms")
+
+
+def main() -> None:
+    """
+    벤치마크 시나리오를 실행합니다.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Slack API 꼬리 지연 벤치마크")
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args: argparse.Namespace = parser.parse_args()
+
+    original_get: Callable[..., Any] = requests.get
+    try:
+        # 시나리오 1: 3% 느린 응답 + 1% 멈춤 — 헤지 요청 유무 비교
+        for hedge_percentile in (0.0, 95.0):
+            requests.get = injected_get(slow_ratio=0.03, hang_ratio=0.01)
+            slack_api.HEDGE_PERCENTILE = hedge_percentile
+            client: SlackAPIClient = SlackAPIClient()
+            client._circuit_breakers["users.info"] = CircuitBreaker(failure_threshold=10 ** 9)
+            label: str = f"hedge p{hedge_percentile:.0f}" if hedge_percentile else "no hedge"
+            summarize(f"[지연 주입] {label}", run_load(client, args.requests, args.concurrency))
+
+        # 시나리오 2: 엔드포인트 장애 (모든 요청 멈춤) — 회로 차단기 + stale 응답 비교
+        slack_api.HEDGE_PERCENTILE = 0.0
+        for use_breaker in (False, True):
+            requests.get = injected_get(slow_ratio=0.0, hang_ratio=0.0)
+            client = SlackAPIClient()
+            if not use_breaker:
+                client._circuit_breakers["users.info"] = CircuitBreaker(failure_threshold=10 ** 9)
+            run_load(client, 50, args.concurrency)
+
+            requests.get = injected_get(slow_ratio=0.0, hang_ratio=1.0)
+            label = "circuit breaker" if use_breaker else "no breaker"
+            summarize(f"[장애] {label}", run_load(client, args.requests // 4, args.concurrency))
+    finally:
+        requests.get = original_get
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,789 @@ typing 모듈을 활용하여 모든 메서드와 변수에 타입 정보를 제
 """
 
 import os
+import re
+import gzip
+import json
+import time
+import logging
+import atexit
+import bisect
+import heapq
+import hashlib
+import shutil
+import tempfile
+import datetime
 import mimetypes
-from typing import Dict, List, Optional, Any, Union, Tuple, BinaryIO
+import threading
+import contextlib
+import contextvars
+from collections import Counter, OrderedDict, deque
+from urllib.parse import urlparse, ParseResult
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Union, Tuple, Set, BinaryIO, Deque, Iterator, Iterable
 import requests
 from dotenv import load_dotenv
 
 # 환경변수 로드
 load_dotenv(".env")
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+# 스냅샷, 채널 분석 상태, 다운로드 파일을 저장할 사용자별 캐시 디렉토리
+# (MCP 호스트가 쓰기 불가능한 작업 디렉토리에서 서버를 실행해도 동작하도록 CWD를 사용하지 않음)
+CACHE_DIR: str = os.getenv(
+    "SLACK_CACHE_DIR", 
+    os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "pepebot")
+)
+
+# Slack Web API 속도 제한 티어별 분당 허용 요청 수
+RATE_LIMIT_TIERS: Dict[int, int] = {1: 1, 2: 20, 3: 50, 4: 100}
+
+# 티어별 순간 허용 요청 수 (Slack은 분당 한도 안에서 짧은 버스트를 허용)
+RATE_LIMIT_BURSTS: Dict[int, int] = {1: 1, 2: 10, 3: 20, 4: 40}
+
+# 엔드포인트별 속도 제한 티어 (https://api.slack.com/docs/rate-limits)
+ENDPOINT_TIERS: Dict[str, int] = {
+    "reactions.add": 3,
+    "conversations.invite": 3,
+    "conversations.members": 4,
+    "conversations.list": 2,
+    "users.list": 2,
+    "conversations.history": 3,
+    "files.info": 4,
+    "search.messages": 2,
+    "users.info": 4,
+    "conversations.info": 3,
+}
+
+# Slack ID 형식 (이름 대신 ID가 들어온 경우 그대로 사용)
+USER_ID_PATTERN: "re.Pattern[str]" = re.compile(r"^[UW][A-Z0-9]{6,}$")
+CHANNEL_ID_PATTERN: "re.Pattern[str]" = re.compile(r"^[CGD][A-Z0-9]{6,}$")
+
+# 429 응답 시 재시도 횟수
+MAX_RATE_LIMIT_RETRIES: int = 3
+
+# users.list / conversations.list 페이지당 항목 수 (Slack 최대값)
+DIRECTORY_PAGE_SIZE: int = 1000
+
+# conversations.invite 한 번에 초대할 수 있는 최대 사용자 수
+INVITE_USERS_PER_REQUEST: int = 1000
+
+# 디렉토리 증분 갱신 결과에 항목별로 담을 최대 변경 수 (나머지는 개수만 보고)
+CHANGELOG_MAX_ENTRIES: int = 100
+
+# 채널 멤버 캐시 유지 시간 (초) - 지나면 초대 전에 멤버 목록을 다시 조회
+CHANNEL_MEMBERS_TTL: float = float(os.getenv("SLACK_CHANNEL_MEMBERS_TTL", "300"))
+
+# HTTP 요청 기본 타임아웃 (초) - 도구 호출 마감 시간이 더 짧으면 그 값을 사용
+DEFAULT_REQUEST_TIMEOUT: float = float(os.getenv("SLACK_REQUEST_TIMEOUT", "10"))
+
+# 헤지 요청을 보낼 지연 백분위수 (0이면 헤지 비활성화)와 계산에 필요한 최소 표본 수
+HEDGE_PERCENTILE: float = float(os.getenv("SLACK_HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES: int = 20
+
+# 회로 차단기: 연속 실패 허용 횟수와 차단 유지 시간 (초)
+CIRCUIT_FAILURE_THRESHOLD: int = 5
+CIRCUIT_RESET_TIMEOUT: float = 30.0
+
+# 장애 시 제공할 마지막 성공 응답(GET) 보관 개수와 대상 엔드포인트
+# (응답이 작은 단건 조회만 보관 - 페이지 단위 목록 조회는 메모리를 많이 차지하므로 제외)
+STALE_RESPONSE_CACHE_SIZE: int = 1024
+STALE_RESPONSE_ENDPOINTS: Set[str] = {"users.info", "conversations.info", "files.info"}
+
+# 현재 도구 호출의 마감 시각 (time.monotonic 기준, 워커 스레드로 전파됨)
+_request_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "slack_request_deadline", default=None
+)
+
+# 디렉토리 캐시 스냅샷 형식 버전 (형식이 바뀌면 올려서 이전 스냅샷을 무시)
+SNAPSHOT_VERSION: int = 2
+
+# 채널 분석 상태 형식 버전과, 사용자 메시지로 세지 않을 시스템 이벤트 subtype
+ANALYTICS_STATE_VERSION: int = 1
+SYSTEM_MESSAGE_SUBTYPES: Set[str] = {
+    "channel_join", "channel_leave", "channel_topic", "channel_purpose", 
+    "channel_name", "channel_archive", "channel_unarchive"
+}
+
+# 업로드 중복 제거용 해시 계산 시 읽기 단위 (바이트)
+HASH_CHUNK_SIZE: int = 1024 * 1024
+
+# 파일 다운로드 시 읽기 단위 (바이트)와 이어받기 재시도 횟수
+DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+DOWNLOAD_MAX_ATTEMPTS: int = 3
+
+# 다중 검색에서 검색어당 조회할 수 있는 최대 페이지 수
+SEARCH_MAX_PAGES_PER_QUERY: int = 20
+
+# 아웃박스에서 병합할 수 있는 메시지 최대 길이 (Slack 권장 text 길이)
+OUTBOX_MAX_TEXT_LENGTH: int = 4000
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 스레드 안전 속도 제한기
+    """
+    
+    def __init__(self, rate_per_minute: int, burst: Optional[int] = None) -> None:
+        """
+        RateLimiter를 초기화합니다.
+        
+        Args:
+            rate_per_minute (int): 분당 허용 요청 수
+            burst (Optional[int]): 순간적으로 허용할 최대 요청 수 (기본값: 10초 분량)
+        """
+        self.rate_per_second: float = rate_per_minute / 60.0
+        self.capacity: float = float(burst or max(1, rate_per_minute // 6))
+        self._tokens: float = self.capacity
+        self._updated_at: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 하나를 얻을 때까지 대기합니다.
+        
+        Args:
+            timeout (Optional[float]): 최대 대기 시간 (초, None이면 무제한, 0이면 대기하지 않음)
+        
+        Returns:
+            bool: 토큰을 얻었는지 여부 (대기 시간 안에 얻을 수 없으면 기다리지 않고 False)
+        """
+        give_up_at: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                
+                wait_seconds: float = (1 - self._tokens) / self.rate_per_second
+            
+            if give_up_at is not None and time.monotonic() + wait_seconds > give_up_at:
+                return False
+            time.sleep(wait_seconds)
+
+
+class LatencyTracker:
+    """
+    엔드포인트별 최근 응답 시간을 기록하고 백분위수를 계산합니다.
+    """
+    
+    def __init__(self, max_samples: int = 200, min_samples: int = HEDGE_MIN_SAMPLES) -> None:
+        """
+        LatencyTracker를 초기화합니다.
+        
+        Args:
+            max_samples (int): 보관할 최근 표본 수 (기본값: 200)
+            min_samples (int): 백분위수를 계산하기 위한 최소 표본 수 (기본값: 20)
+        """
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.min_samples: int = min_samples
+        self._lock: threading.Lock = threading.Lock()
+    
+    def record(self, seconds: float) -> None:
+        """
+        응답 시간 하나를 기록합니다.
+        
+        Args:
+            seconds (float): 응답 시간 (초)
+        """
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        기록된 응답 시간의 백분위수를 반환합니다.
+        
+        Args:
+            percentile (float): 백분위수 (0~100)
+        
+        Returns:
+            Optional[float]: 백분위수 응답 시간 (표본이 부족하면 None)
+        """
+        with self._lock:
+            if not self._samples or len(self._samples) < self.min_samples:
+                return None
+            ordered: List[float] = sorted(self._samples)
+        
+        position: int = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[position]
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 회로 차단기 (closed → open → half_open)
+    
+    연속으로 전송 실패가 일정 횟수를 넘으면 일정 시간 동안 요청을 즉시 실패시키고,
+    이후 요청 하나를 시험 삼아 통과시켜 성공하면 다시 닫힙니다.
+    시험 요청의 결과가 reset_timeout 안에 기록되지 않으면 다음 시험 요청을 허용합니다.
+    """
+    
+    def __init__(
+        self, 
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, 
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT
+    ) -> None:
+        """
+        CircuitBreaker를 초기화합니다.
+        
+        Args:
+            failure_threshold (int): 차단을 시작할 연속 실패 횟수
+            reset_timeout (float): 차단 후 시험 요청을 허용하기까지의 시간 (초)
+        """
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.state: str = "closed"
+        self.failures: int = 0
+        self._opened_at: float = 0.0
+        self._probe_started_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다.
+        
+        Returns:
+            bool: 요청 허용 여부
+        """
+        with self._lock:
+            if self.state == "closed":
+                return True
+            
+            now: float = time.monotonic()
+            probe_expired: bool = self.state == "half_open" and now - self._probe_started_at >= self.reset_timeout
+            if probe_expired or (self.state == "open" and now - self._opened_at >= self.reset_timeout):
+                # 시험 요청 하나만 통과
+                self.state = "half_open"
+                self._probe_started_at = now
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """
+        요청 성공을 기록하고 차단기를 닫습니다.
+        """
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+    
+    def record_failure(self) -> None:
+        """
+        요청 실패를 기록하고, 필요하면 차단기를 엽니다.
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class OutboxBatch:
+    """
+    아웃박스에서 한 채널로 병합 전송될 메시지 묶음
+    """
+    
+    def __init__(self) -> None:
+        """
+        빈 OutboxBatch를 초기화합니다.
+        """
+        self.texts: List[str] = []
+        self.length: int = 0
+        self.flushed: bool = False
+        self.timer: Optional[threading.Timer] = None
+        self.result: Future = Future()
+    
+    def fits(self, text: str) -> bool:
+        """
+        메시지를 추가해도 최대 길이를 넘지 않는지 확인합니다.
+        
+        Args:
+            text (str): 추가할 메시지 내용
+        
+        Returns:
+            bool: 추가 가능 여부
+        """
+        separator_length: int = 1 if self.texts else 0
+        return self.length + separator_length + len(text) <= OUTBOX_MAX_TEXT_LENGTH
+    
+    def add(self, text: str) -> None:
+        """
+        메시지를 묶음에 추가합니다.
+        
+        Args:
+            text (str): 추가할 메시지 내용
+        """
+        self.length += (1 if self.texts else 0) + len(text)
+        self.texts.append(text)
+
+
+class EntityIndex:
+    """
+    사용자/채널 디렉토리에 대한 이름 → ID 인메모리 인덱스
+    
+    정확히 일치, 대소문자 무시 일치, 접두사 일치, 트라이그램 기반 유사 일치를 지원합니다.
+    """
+    
+    # 사용자/채널별로 인덱싱할 필드
+    USER_FIELDS: Tuple[str, ...] = ("name", "real_name", "display_name", "email")
+    CHANNEL_FIELDS: Tuple[str, ...] = ("name",)
+    
+    def __init__(self) -> None:
+        """
+        빈 EntityIndex를 초기화합니다.
+        """
+        # 백그라운드 증분 갱신과 도구 스레드의 검색이 동시에 일어나므로 모든 접근을 잠금으로 보호
+        self._lock: threading.RLock = threading.RLock()
+        self._reset()
+    
+    def _reset(self) -> None:
+        """
+        인덱스를 비웁니다.
+        """
+        self._entities: Dict[str, Dict[str, Any]] = {}
+        self._keys_by_id: Dict[str, List[str]] = {}
+        self._exact: Dict[str, Set[str]] = {}
+        self._folded: Dict[str, Set[str]] = {}
+        self._sorted_keys: List[str] = []
+        # 유사 검색용 트라이그램 색인 (첫 유사 검색 시 생성)
+        self._trigrams: Optional[Dict[str, Set[str]]] = None
+    
+    @staticmethod
+    def _fold(value: str) -> str:
+        """
+        비교용으로 문자열을 정규화합니다 (앞의 #/@ 제거, 대소문자 무시).
+        
+        Args:
+            value (str): 원본 문자열
+        
+        Returns:
+            str: 정규화된 문자열
+        """
+        return value.strip().lstrip("#@").casefold()
+    
+    @staticmethod
+    def _trigrams_of(value: str) -> Set[str]:
+        """
+        문자열의 트라이그램 집합을 반환합니다.
+        
+        Args:
+            value (str): 정규화된 문자열
+        
+        Returns:
+            Set[str]: 트라이그램 집합
+        """
+        padded: str = f"  {value} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def _index_trigrams(self, folded: str) -> None:
+        """
+        정규화된 키를 트라이그램 색인에 추가합니다.
+        
+        Args:
+            folded (str): 정규화된 키
+        """
+        assert self._trigrams is not None
+        for trigram in self._trigrams_of(folded):
+            self._trigrams.setdefault(trigram, set()).add(folded)
+    
+    def __len__(self) -> int:
+        """
+        인덱싱된 사용자/채널 수를 반환합니다.
+        """
+        with self._lock:
+            return len(self._entities)
+    
+    def build(self, users: List[Dict[str, Any]], channels: List[Dict[str, Any]]) -> None:
+        """
+        디렉토리 전체로 인덱스를 새로 만듭니다.
+        
+        Args:
+            users (List[Dict[str, Any]]): get_users 형식의 사용자 목록
+            channels (List[Dict[str, Any]]): get_channels 형식의 채널 목록
+        """
+        with self._lock:
+            self._reset()
+            for user in users:
+                self.add("user", user, keep_sorted=False)
+            for channel in channels:
+                self.add("channel", channel, keep_sorted=False)
+            self._sorted_keys.sort()
+    
+    def add(self, entity_type: str, entity: Dict[str, Any], keep_sorted: bool = True) -> None:
+        """
+        사용자 또는 채널 하나를 인덱스에 추가합니다 (이미 있으면 교체).
+        
+        Args:
+            entity_type (str): "user" 또는 "channel"
+            entity (Dict[str, Any]): 사용자/채널 정보
+            keep_sorted (bool): 접두사 검색용 정렬 목록을 즉시 갱신할지 여부
+        """
+        with self._lock:
+            entity_id: str = entity["id"]
+            if entity_id in self._entities:
+                self.remove(entity_id)
+            
+            fields: Tuple[str, ...] = self.USER_FIELDS if entity_type == "user" else self.CHANNEL_FIELDS
+            summary: Dict[str, Any] = {"id": entity_id, "type": entity_type}
+            keys: List[str] = []
+            
+            for field in fields:
+                value: str = entity.get(field) or ""
+                summary[field] = value
+                if value and value not in keys:
+                    keys.append(value)
+            
+            self._entities[entity_id] = summary
+            self._keys_by_id[entity_id] = keys
+            
+            for key in keys:
+                self._exact.setdefault(key, set()).add(entity_id)
+                folded: str = self._fold(key)
+                
+                if folded not in self._folded:
+                    self._folded[folded] = set()
+                    if keep_sorted:
+                        bisect.insort(self._sorted_keys, folded)
+                    else:
+                        self._sorted_keys.append(folded)
+                    if self._trigrams is not None:
+                        self._index_trigrams(folded)
+                
+                self._folded[folded].add(entity_id)
+    
+    def remove(self, entity_id: str) -> None:
+        """
+        사용자 또는 채널 하나를 인덱스에서 제거합니다.
+        
+        Args:
+            entity_id (str): 제거할 사용자/채널 ID
+        """
+        with self._lock:
+            if self._entities.pop(entity_id, None) is None:
+                return
+            
+            for key in self._keys_by_id.pop(entity_id, []):
+                exact_ids: Set[str] = self._exact.get(key, set())
+                exact_ids.discard(entity_id)
+                if not exact_ids:
+                    self._exact.pop(key, None)
+                
+                folded: str = self._fold(key)
+                folded_ids: Optional[Set[str]] = self._folded.get(folded)
+                if folded_ids is None:
+                    continue
+                
+                folded_ids.discard(entity_id)
+                if not folded_ids:
+                    del self._folded[folded]
+                    position: int = bisect.bisect_left(self._sorted_keys, folded)
+                    if position < len(self._sorted_keys) and self._sorted_keys[position] == folded:
+                        del self._sorted_keys[position]
+                    if self._trigrams is not None:
+                        for trigram in self._trigrams_of(folded):
+                            trigram_keys: Set[str] = self._trigrams.get(trigram, set())
+                            trigram_keys.discard(folded)
+                            if not trigram_keys:
+                                self._trigrams.pop(trigram, None)
+    
+    def get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        ID로 인덱싱된 사용자/채널 정보를 조회합니다.
+        
+        Args:
+            entity_id (str): 사용자/채널 ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: 사용자/채널 정보 (없으면 None)
+        """
+        with self._lock:
+            return self._entities.get(entity_id)
+    
+    def _fuzzy_candidates(self, folded: str, count: int) -> List[Tuple[str, float]]:
+        """
+        트라이그램 Dice 계수가 높은 키를 찾습니다.
+        흔한 트라이그램(예: 이메일 도메인)은 후보 수집에서 제외해 검색 비용을 제한합니다.
+        
+        Args:
+            folded (str): 정규화된 검색어
+            count (int): 반환할 최대 후보 수
+        
+        Returns:
+            List[Tuple[str, float]]: (키, 유사도) 목록
+        """
+        if self._trigrams is None:
+            self._trigrams = {}
+            for key in self._folded:
+                self._index_trigrams(key)
+        
+        query_trigrams: Set[str] = self._trigrams_of(folded)
+        postings: List[Set[str]] = sorted(
+            (self._trigrams[trigram] for trigram in query_trigrams if trigram in self._trigrams), 
+            key=len
+        )
+        
+        # 드문 트라이그램부터 사용하되, 최소 두 개는 항상 사용
+        max_postings: int = max(256, len(self._folded) // 50)
+        selected: List[Set[str]] = [
+            keys for position, keys in enumerate(postings) if position < 2 or len(keys) <= max_postings
+        ]
+        
+        shared_counts: Dict[str, int] = {}
+        for keys in selected:
+            for key in keys:
+                shared_counts[key] = shared_counts.get(key, 0) + 1
+        
+        candidates: List[Tuple[str, int]] = heapq.nlargest(count, shared_counts.items(), key=lambda item: item[1])
+        scored: List[Tuple[str, float]] = []
+        for key, _ in candidates:
+            key_trigrams: Set[str] = self._trigrams_of(key)
+            similarity: float = 2.0 * len(query_trigrams & key_trigrams) / (len(query_trigrams) + len(key_trigrams))
+            if similarity >= 0.4:
+                scored.append((key, similarity))
+        
+        return scored
+    
+    def search(self, query: str, entity_type: Optional[str] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        이름, 실명, 표시 이름, 이메일로 사용자/채널을 검색합니다.
+        정확 일치 → 대소문자 무시 일치 → 접두사 일치 → 유사 일치 순으로 점수를 매깁니다.
+        
+        Args:
+            query (str): 검색어 (예: "#general", "@pepe", "pepe@example.com")
+            entity_type (Optional[str]): "user" 또는 "channel"로 제한 (기본값: 전체)
+            limit (int): 반환할 최대 결과 수 (기본값: 5)
+        
+        Returns:
+            List[Dict[str, Any]]: 점수순 검색 결과 (match_type, score 포함)
+        """
+        with self._lock:
+            matches: Dict[str, Tuple[float, str]] = {}
+            stripped: str = query.strip().lstrip("#@")
+            folded: str = self._fold(query)
+            
+            if not folded:
+                return []
+            
+            def collect(entity_ids: Set[str], score: float, match_type: str) -> None:
+                for entity_id in entity_ids:
+                    if entity_type and self._entities[entity_id]["type"] != entity_type:
+                        continue
+                    if entity_id not in matches or matches[entity_id][0] < score:
+                        matches[entity_id] = (score, match_type)
+            
+            collect(self._exact.get(stripped, set()), 1.0, "exact")
+            collect(self._folded.get(folded, set()), 0.95, "casefold")
+            
+            # 접두사 일치: 정렬된 키 목록에서 이진 탐색
+            if len(matches) < limit:
+                position: int = bisect.bisect_left(self._sorted_keys, folded)
+                scan_end: int = min(len(self._sorted_keys), position + limit * 20)
+                while position < scan_end and len(matches) < limit * 4:
+                    key: str = self._sorted_keys[position]
+                    if not key.startswith(folded):
+                        break
+                    collect(self._folded[key], 0.8 * len(folded) / len(key), "prefix")
+                    position += 1
+            
+            # 유사 일치: 다른 방식으로 찾지 못한 경우에만 트라이그램 Dice 계수로 검색
+            if not matches:
+                for key, similarity in self._fuzzy_candidates(folded, limit * 4):
+                    collect(self._folded[key], 0.7 * similarity, "fuzzy")
+            
+            ranked: List[Tuple[str, Tuple[float, str]]] = sorted(matches.items(), key=lambda item: -item[1][0])
+            
+            return [
+                dict(self._entities[entity_id], match_type=match_type, score=round(score, 3))
+                for entity_id, (score, match_type) in ranked[:limit]
+            ]
+
+
+class ChannelActivityStats:
+    """
+    채널 메시지를 한 번씩 흘려보내며 누적하는 활동 통계
+    
+    메시지 자체는 보관하지 않으므로 메모리 사용량은 메시지 수가 아니라
+    사용자 수와 날짜 수에만 비례합니다.
+    """
+    
+    def __init__(self, utc_offset_hours: float = 0.0) -> None:
+        """
+        빈 ChannelActivityStats를 초기화합니다.
+        
+        Args:
+            utc_offset_hours (float): 시간대 히스토그램에 사용할 UTC 오프셋 (예: KST는 9)
+        """
+        self.utc_offset_hours: float = utc_offset_hours
+        self.message_count: int = 0
+        self.system_event_count: int = 0
+        self.bot_message_count: int = 0
+        self.thread_parent_count: int = 0
+        self.thread_reply_count: int = 0
+        self.thread_broadcast_count: int = 0
+        self.hourly: List[int] = [0] * 24
+        self.weekday: List[int] = [0] * 7
+        self.daily: Counter = Counter()
+        self.user_counts: Counter = Counter()
+        self.reactor_counts: Counter = Counter()
+        self.emoji_counts: Counter = Counter()
+        self.watermark: str = ""
+        # 중단된 조회에서 아직 집계하지 못한 오래된 구간 (resume_oldest, resume_latest), 둘 다 배타적
+        self.resume_oldest: str = ""
+        self.resume_latest: str = ""
+    
+    def add(self, message: Dict[str, Any]) -> None:
+        """
+        conversations.history 메시지 하나를 통계에 반영합니다.
+        
+        Args:
+            message (Dict[str, Any]): Slack 메시지 객체
+        """
+        ts: str = message.get("ts", "")
+        if ts and (not self.watermark or float(ts) > float(self.watermark)):
+            self.watermark = ts
+        
+        subtype: str = message.get("subtype", "")
+        if subtype in SYSTEM_MESSAGE_SUBTYPES:
+            self.system_event_count += 1
+            return
+        
+        self.message_count += 1
+        
+        if message.get("bot_id") or subtype == "bot_message":
+            self.bot_message_count += 1
+        elif message.get("user"):
+            self.user_counts[message["user"]] += 1
+        
+        if ts:
+            posted_at: datetime.datetime = datetime.datetime.fromtimestamp(
+                float(ts), tz=datetime.timezone(datetime.timedelta(hours=self.utc_offset_hours))
+            )
+            self.hourly[posted_at.hour] += 1
+            self.weekday[posted_at.weekday()] += 1
+            self.daily[posted_at.date().isoformat()] += 1
+        
+        # 스레드 부모 메시지의 reply_count로 답글 수 집계 (답글 자체는 history에 포함되지 않음)
+        if message.get("reply_count"):
+            self.thread_parent_count += 1
+            self.thread_reply_count += message["reply_count"]
+        if subtype == "thread_broadcast":
+            self.thread_broadcast_count += 1
+        
+        for reaction in message.get("reactions", []):
+            self.emoji_counts[reaction.get("name", "")] += reaction.get("count", 0)
+            for user_id in reaction.get("users", []):
+                self.reactor_counts[user_id] += 1
+    
+    def add_all(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """
+        여러 메시지를 통계에 반영합니다.
+        
+        Args:
+            messages (Iterable[Dict[str, Any]]): Slack 메시지 객체들
+        """
+        for message in messages:
+            self.add(message)
+    
+    def to_state(self) -> Dict[str, Any]:
+        """
+        증분 재계산을 위해 저장할 상태를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: JSON으로 저장 가능한 누적 상태
+        """
+        return {
+            "version": ANALYTICS_STATE_VERSION,
+            "utc_offset_hours": self.utc_offset_hours,
+            "message_count": self.message_count,
+            "system_event_count": self.system_event_count,
+            "bot_message_count": self.bot_message_count,
+            "thread_parent_count": self.thread_parent_count,
+            "thread_reply_count": self.thread_reply_count,
+            "thread_broadcast_count": self.thread_broadcast_count,
+            "hourly": self.hourly,
+            "weekday": self.weekday,
+            "daily": dict(self.daily),
+            "user_counts": dict(self.user_counts),
+            "reactor_counts": dict(self.reactor_counts),
+            "emoji_counts": dict(self.emoji_counts),
+            "watermark": self.watermark,
+            "resume_oldest": self.resume_oldest,
+            "resume_latest": self.resume_latest
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> Optional["ChannelActivityStats"]:
+        """
+        저장된 상태에서 통계를 복원합니다.
+        
+        Args:
+            state (Dict[str, Any]): to_state로 저장한 상태
+        
+        Returns:
+            Optional[ChannelActivityStats]: 복원된 통계 (버전이 다르면 None)
+        """
+        if state.get("version") != ANALYTICS_STATE_VERSION:
+            return None
+        
+        stats: ChannelActivityStats = cls(state.get("utc_offset_hours", 0.0))
+        for field in ("message_count", "system_event_count", "bot_message_count", 
+                      "thread_parent_count", "thread_reply_count", "thread_broadcast_count"):
+            setattr(stats, field, state.get(field, 0))
+        stats.hourly = list(state.get("hourly", stats.hourly))
+        stats.weekday = list(state.get("weekday", stats.weekday))
+        stats.daily = Counter(state.get("daily", {}))
+        stats.user_counts = Counter(state.get("user_counts", {}))
+        stats.reactor_counts = Counter(state.get("reactor_counts", {}))
+        stats.emoji_counts = Counter(state.get("emoji_counts", {}))
+        stats.watermark = state.get("watermark", "")
+        stats.resume_oldest = state.get("resume_oldest", "")
+        stats.resume_latest = state.get("resume_latest", "")
+        return stats
+    
+    def summary(self, top_n: int = 10, names: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        LLM에 전달할 압축된 집계 결과를 반환합니다.
+        
+        Args:
+            top_n (int): 상위 사용자/반응자/이모지 수 (기본값: 10)
+            names (Optional[Dict[str, str]]): 사용자 ID → 이름 (있으면 결과에 포함)
+        
+        Returns:
+            Dict[str, Any]: 메시지 수, 상위 사용자, 시간대/요일/일별 히스토그램, 스레드 비율, 상위 반응자
+        """
+        names = names or {}
+        
+        def ranked(counter: Counter, key: str) -> List[Dict[str, Any]]:
+            return [
+                {key: item_id, "name": names.get(item_id, ""), "count": count} if key == "user_id" 
+                else {key: item_id, "count": count}
+                for item_id, count in counter.most_common(top_n)
+            ]
+        
+        return {
+            "message_count": self.message_count,
+            "bot_message_count": self.bot_message_count,
+            "system_event_count": self.system_event_count,
+            "active_users": len(self.user_counts),
+            "top_users": ranked(self.user_counts, "user_id"),
+            "hourly_histogram": self.hourly,
+            "weekday_histogram": dict(zip(["mon", "tue", "wed", "thu", "fri", "sat", "sun"], self.weekday)),
+            "daily_histogram": dict(sorted(self.daily.items())),
+            "threads": {
+                "thread_parents": self.thread_parent_count,
+                "thread_replies": self.thread_reply_count,
+                "thread_broadcasts": self.thread_broadcast_count,
+                "thread_ratio": round(self.thread_parent_count / self.message_count, 3) if self.message_count else 0.0,
+                "replies_per_thread": round(self.thread_reply_count / self.thread_parent_count, 2) if self.thread_parent_count else 0.0
+            },
+            "top_reactors": ranked(self.reactor_counts, "user_id"),
+            "top_emojis": ranked(self.emoji_counts, "emoji")
+        }
+
 
 class SlackAPIClient:
     """
@@ -24,338 +799,1896 @@ class SlackAPIClient:
         """
         SlackAPIClient를 초기화합니다.
         
-        Raises:
-            ValueError: SLACK_BOT_TOKEN 환경변수가 설정되지 않은 경우
-        """
-        self.bot_token: Optional[str] = os.getenv("SLACK_BOT_TOKEN")
-        self.user_token: Optional[str] = os.getenv("SLACK_USER_TOKEN")
+        Raises:
+            ValueError: SLACK_BOT_TOKEN 환경변수가 설정되지 않은 경우
+        """
+        self.bot_token: Optional[str] = os.getenv("SLACK_BOT_TOKEN")
+        self.user_token: Optional[str] = os.getenv("SLACK_USER_TOKEN")
+        
+        if not self.bot_token:
+            raise ValueError("SLACK_BOT_TOKEN 환경변수가 설정되지 않았습니다.")
+        
+        self.base_url: str = "https://slack.com/api"
+        
+        # Bot Token용 헤더 (기본)
+        self.headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self.bot_token}",
+            "Content-Type": "application/json"
+        }
+        
+        # User Token용 헤더 (검색 기능용)
+        self.user_headers: Optional[Dict[str, str]] = None
+        if self.user_token:
+            self.user_headers = {
+                "Authorization": f"Bearer {self.user_token}",
+                "Content-Type": "application/json"
+            }
+        
+        # 동시 요청 처리를 위한 워커 풀과 엔드포인트별 속도 제한기
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("SLACK_MAX_WORKERS", "8")),
+            thread_name_prefix="slack-api"
+        )
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock: threading.Lock = threading.Lock()
+        
+        # 꼬리 지연 대응: 헤지 요청 전용 풀, 엔드포인트별 회로 차단기/응답 시간, 장애 시 제공할 마지막 응답
+        self._hedge_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("SLACK_HEDGE_WORKERS", "16")),
+            thread_name_prefix="slack-hedge"
+        )
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._latency_trackers: Dict[str, LatencyTracker] = {}
+        self._stale_responses: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stale_lock: threading.Lock = threading.Lock()
+        self._stats_lock: threading.Lock = threading.Lock()
+        self.hedged_requests: int = 0
+        self.hedge_wins: int = 0
+        
+        # 채널별 메시지 병합 전송(아웃박스) 설정 - 0이면 비활성화
+        self.outbox_window: float = float(os.getenv("SLACK_OUTBOX_WINDOW", "0"))
+        self._outbox: Dict[str, OutboxBatch] = {}
+        self._outbox_lock: threading.Lock = threading.Lock()
+        
+        # 채널별 멤버 ID 캐시와 조회 시각 (일괄 초대 시 이미 참여 중인 사용자 건너뛰기용)
+        self._channel_members: Dict[str, Set[str]] = {}
+        self._channel_members_fetched_at: Dict[str, float] = {}
+        self._channel_members_lock: threading.Lock = threading.Lock()
+        
+        # 사용자/채널 디렉토리 캐시와 이름 → ID 인덱스
+        self._users_directory: Optional[List[Dict[str, Any]]] = None
+        self._channels_directory: Optional[List[Dict[str, Any]]] = None
+        self._entity_index: Optional[EntityIndex] = None
+        self._directory_lock: threading.RLock = threading.RLock()
+        self._users_fetched_at: float = 0.0
+        self._channels_fetched_at: float = 0.0
+        self._directory_loading: Optional[threading.Event] = None
+        
+        # 사용자 ID → DM 채널 ID 캐시
+        self._dm_channels: Dict[str, str] = {}
+        
+        # 파일 내용 해시 → 업로드된 Slack 파일 (중복 업로드 방지)
+        self._upload_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # 다운로드 파일 캐시 (file_id별 로컬 사본, 용량 초과 시 오래 안 쓴 파일부터 삭제)
+        self.blob_cache_dir: str = os.getenv("SLACK_BLOB_CACHE_DIR", os.path.join(CACHE_DIR, "blobs"))
+        self.blob_cache_max_bytes: int = int(os.getenv("SLACK_BLOB_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+        self._download_locks: Dict[str, threading.Lock] = {}
+        
+        # 디렉토리 캐시 스냅샷 설정 (빈 경로면 비활성화)
+        self.snapshot_path: str = os.getenv(
+            "SLACK_CACHE_SNAPSHOT", os.path.join(CACHE_DIR, "directory_snapshot.json.gz")
+        )
+        self.snapshot_ttl: float = float(os.getenv("SLACK_CACHE_TTL", "86400"))
+        self.snapshot_refresh_after: float = float(os.getenv("SLACK_CACHE_REFRESH_AFTER", "3600"))
+        self._snapshot_loaded: bool = False
+        self._snapshot_dirty: bool = False
+        self._snapshot_refreshing: bool = False
+        atexit.register(self._save_snapshot_if_dirty)
+    
+    def make_request(
+        self, 
+        endpoint: str, 
+        method: str = "GET", 
+        data: Optional[Dict[str, Any]] = None, 
+        use_user_token: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Slack API 요청을 위한 헬퍼 메서드
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            method (str): HTTP 메서드 (GET 또는 POST)
+            data (Optional[Dict[str, Any]]): 요청 데이터
+            use_user_token (bool): User Token 사용 여부 (검색 기능용)
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        url: str = f"{self.base_url}/{endpoint}"
+        
+        # User Token 사용 시
+        if use_user_token:
+            if not self.user_headers:
+                return {
+                    "ok": False,
+                    "error": "SLACK_USER_TOKEN 환경변수가 설정되지 않았습니다."
+                }
+            headers: Dict[str, str] = self.user_headers
+        else:
+            headers = self.headers
+        
+        breaker: CircuitBreaker = self._get_circuit_breaker(endpoint)
+        stale_key: Optional[str] = None
+        if method == "GET" and endpoint in STALE_RESPONSE_ENDPOINTS and "cursor" not in (data or {}):
+            stale_key = json.dumps([endpoint, use_user_token, data or {}], sort_keys=True, default=str)
+        
+        # 마감 시간을 먼저 확인 (차단기의 시험 요청 기회를 쓰지 않도록)
+        timeout: Optional[float] = self.request_timeout()
+        if timeout is None:
+            return self._stale_response(stale_key, {
+                "ok": False,
+                "error": "deadline_exceeded",
+                "message": "도구 호출 마감 시간이 지났습니다."
+            })
+        
+        # 장애 중인 엔드포인트는 즉시 실패 (가능하면 마지막 성공 응답 제공)
+        if not breaker.allow():
+            return self._stale_response(stale_key, {
+                "ok": False,
+                "error": "circuit_open",
+                "message": f"{endpoint} 엔드포인트가 일시적으로 차단되었습니다."
+            })
+        
+        result: Dict[str, Any] = {}
+        transport_ok: bool = False
+        try:
+            if method == "GET":
+                result, transport_ok = self._hedged_get(endpoint, url, headers, data, timeout)
+            else:
+                result, transport_ok = self._send_http(endpoint, method, url, headers, data, timeout)
+        finally:
+            # 예외가 나도 결과를 기록하여 차단기가 half_open에 머물지 않도록
+            if transport_ok:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        
+        if not transport_ok:
+            return self._stale_response(stale_key, result)
+        
+        if stale_key is not None and result.get("ok"):
+            with self._stale_lock:
+                self._stale_responses[stale_key] = result
+                self._stale_responses.move_to_end(stale_key)
+                while len(self._stale_responses) > STALE_RESPONSE_CACHE_SIZE:
+                    self._stale_responses.popitem(last=False)
+        
+        return result
+    
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """
+        블록 안에서 보내는 모든 Slack 요청에 마감 시간을 적용합니다.
+        이미 더 이른 마감 시간이 있으면 그 값을 유지하며, 워커 스레드에도 전파됩니다.
+        
+        Args:
+            seconds (float): 지금부터의 마감 시간 (초)
+        """
+        new_deadline: float = time.monotonic() + seconds
+        current_deadline: Optional[float] = _request_deadline.get()
+        if current_deadline is not None:
+            new_deadline = min(new_deadline, current_deadline)
+        
+        token: contextvars.Token = _request_deadline.set(new_deadline)
+        try:
+            yield
+        finally:
+            _request_deadline.reset(token)
+    
+    def request_timeout(self, default: float = DEFAULT_REQUEST_TIMEOUT) -> Optional[float]:
+        """
+        현재 마감 시간을 고려한 HTTP 요청 타임아웃을 계산합니다.
+        
+        Args:
+            default (float): 마감 시간이 없을 때의 타임아웃 (초)
+        
+        Returns:
+            Optional[float]: 타임아웃 (초), 마감 시간이 이미 지났으면 None
+        """
+        current_deadline: Optional[float] = _request_deadline.get()
+        if current_deadline is None:
+            return default
+        
+        remaining: float = current_deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(default, remaining)
+    
+    def _send_http(
+        self, 
+        endpoint: str, 
+        method: str, 
+        url: str, 
+        headers: Dict[str, str], 
+        data: Optional[Dict[str, Any]], 
+        timeout: float
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        HTTP 요청 하나를 보내고 응답 시간을 기록합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            method (str): HTTP 메서드 (GET 또는 POST)
+            url (str): 요청 URL
+            headers (Dict[str, str]): 요청 헤더
+            data (Optional[Dict[str, Any]]): 요청 데이터
+            timeout (float): 타임아웃 (초)
+        
+        Returns:
+            Tuple[Dict[str, Any], bool]: (API 응답 결과, 전송 성공 여부)
+                - 전송 실패(연결 오류, 타임아웃, 5xx)만 회로 차단기에 실패로 기록됩니다.
+        """
+        started_at: float = time.monotonic()
+        try:
+            response: requests.Response
+            if method == "GET":
+                response = requests.get(url, headers=headers, params=data, timeout=timeout)
+            else:
+                response = requests.post(url, headers=headers, json=data, timeout=timeout)
+            
+            response.raise_for_status()
+            result: Dict[str, Any] = response.json()
+            self._get_latency_tracker(endpoint).record(time.monotonic() - started_at)
+            return result, True
+        except requests.RequestException as e:
+            # 속도 제한에 걸린 경우 재시도 대기 시간을 함께 반환
+            if e.response is not None and e.response.status_code == 429:
+                return {
+                    "ok": False,
+                    "error": "ratelimited",
+                    "retry_after": int(e.response.headers.get("Retry-After", "1"))
+                }, True
+            transport_ok: bool = e.response is not None and e.response.status_code < 500
+            return {
+                "ok": False,
+                "error": f"HTTP 요청 오류: {str(e)}"
+            }, transport_ok
+    
+    def _hedged_get(
+        self, 
+        endpoint: str, 
+        url: str, 
+        headers: Dict[str, str], 
+        data: Optional[Dict[str, Any]], 
+        timeout: float
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        멱등 조회(GET) 요청을 보내고, 응답이 최근 지연 백분위수보다 늦으면
+        같은 요청을 한 번 더 보내 먼저 도착한 응답을 사용합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            url (str): 요청 URL
+            headers (Dict[str, str]): 요청 헤더
+            data (Optional[Dict[str, Any]]): 요청 데이터
+            timeout (float): 타임아웃 (초)
+        
+        Returns:
+            Tuple[Dict[str, Any], bool]: (API 응답 결과, 전송 성공 여부)
+        """
+        hedge_delay: Optional[float] = None
+        if HEDGE_PERCENTILE > 0:
+            hedge_delay = self._get_latency_tracker(endpoint).percentile(HEDGE_PERCENTILE)
+        
+        if hedge_delay is None or hedge_delay >= timeout:
+            return self._send_http(endpoint, "GET", url, headers, data, timeout)
+        
+        primary: Future = self._hedge_executor.submit(
+            self._send_http, endpoint, "GET", url, headers, data, timeout
+        )
+        done, _ = wait([primary], timeout=hedge_delay)
+        if done:
+            return primary.result()
+        
+        # 헤지 요청도 속도 제한 한도에 포함 (토큰이 없으면 헤지하지 않음)
+        if not self._get_rate_limiter(endpoint).acquire(timeout=0):
+            return primary.result()
+        
+        with self._stats_lock:
+            self.hedged_requests += 1
+        hedge: Future = self._hedge_executor.submit(
+            self._send_http, endpoint, "GET", url, headers, data, timeout - hedge_delay
+        )
+        
+        # 전송에 성공한 응답을 우선 사용하고, 둘 다 실패하면 먼저 끝난 실패를 반환
+        pending: Set[Future] = {primary, hedge}
+        first_failure: Optional[Tuple[Dict[str, Any], bool]] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result: Tuple[Dict[str, Any], bool] = future.result()
+                if result[1]:
+                    if future is hedge:
+                        with self._stats_lock:
+                            self.hedge_wins += 1
+                    return result
+                first_failure = first_failure or result
+        
+        assert first_failure is not None
+        return first_failure
+    
+    def _stale_response(self, stale_key: Optional[str], error_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        요청이 실패했을 때 같은 요청의 마지막 성공 응답이 있으면 그것을 반환합니다.
+        
+        Args:
+            stale_key (Optional[str]): 요청 캐시 키 (GET 요청만 해당)
+            error_result (Dict[str, Any]): 캐시가 없을 때 반환할 오류 응답
+        
+        Returns:
+            Dict[str, Any]: 마지막 성공 응답(stale 표시 포함) 또는 오류 응답
+        """
+        if stale_key is not None:
+            with self._stale_lock:
+                cached: Optional[Dict[str, Any]] = self._stale_responses.get(stale_key)
+            if cached is not None:
+                return dict(cached, stale=True, stale_reason=error_result.get("error", ""))
+        return error_result
+    
+    def _get_circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        엔드포인트 전용 회로 차단기를 반환합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+        
+        Returns:
+            CircuitBreaker: 엔드포인트 전용 회로 차단기
+        """
+        with self._stats_lock:
+            breaker: Optional[CircuitBreaker] = self._circuit_breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker()
+                self._circuit_breakers[endpoint] = breaker
+            return breaker
+    
+    def _get_latency_tracker(self, endpoint: str) -> LatencyTracker:
+        """
+        엔드포인트 전용 응답 시간 기록기를 반환합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+        
+        Returns:
+            LatencyTracker: 엔드포인트 전용 응답 시간 기록기
+        """
+        with self._stats_lock:
+            tracker: Optional[LatencyTracker] = self._latency_trackers.get(endpoint)
+            if tracker is None:
+                tracker = LatencyTracker()
+                self._latency_trackers[endpoint] = tracker
+            return tracker
+    
+    def get_endpoint_health(self) -> Dict[str, Any]:
+        """
+        엔드포인트별 회로 차단기 상태와 응답 시간 백분위수를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: 엔드포인트별 상태, p50/p99 응답 시간, 헤지 요청 통계
+        """
+        with self._stats_lock:
+            endpoints: List[str] = sorted(set(self._circuit_breakers) | set(self._latency_trackers))
+        
+        health: Dict[str, Dict[str, Any]] = {}
+        for endpoint in endpoints:
+            tracker: LatencyTracker = self._get_latency_tracker(endpoint)
+            p50: Optional[float] = tracker.percentile(50)
+            p99: Optional[float] = tracker.percentile(99)
+            health[endpoint] = {
+                "circuit_state": self._get_circuit_breaker(endpoint).state,
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p99_ms": round(p99 * 1000, 1) if p99 is not None else None
+            }
+        
+        return {
+            "success": True,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+            "endpoints": health
+        }
+    
+    def _get_rate_limiter(self, endpoint: str) -> RateLimiter:
+        """
+        엔드포인트의 티어에 맞는 속도 제한기를 반환합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+        
+        Returns:
+            RateLimiter: 엔드포인트 전용 속도 제한기
+        """
+        with self._rate_limiters_lock:
+            limiter: Optional[RateLimiter] = self._rate_limiters.get(endpoint)
+            if limiter is None:
+                tier: int = ENDPOINT_TIERS.get(endpoint, 3)
+                limiter = RateLimiter(RATE_LIMIT_TIERS[tier], RATE_LIMIT_BURSTS.get(tier))
+                self._rate_limiters[endpoint] = limiter
+            return limiter
+    
+    def rate_limited_request(
+        self, 
+        endpoint: str, 
+        method: str = "GET", 
+        data: Optional[Dict[str, Any]] = None, 
+        use_user_token: bool = False
+    ) -> Dict[str, Any]:
+        """
+        엔드포인트의 속도 제한 티어를 지키면서 API 요청을 보냅니다.
+        429 응답을 받으면 Retry-After 만큼 기다린 뒤 재시도합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            method (str): HTTP 메서드 (GET 또는 POST)
+            data (Optional[Dict[str, Any]]): 요청 데이터
+            use_user_token (bool): User Token 사용 여부
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        limiter: RateLimiter = self._get_rate_limiter(endpoint)
+        result: Dict[str, Any] = {}
+        
+        for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # 마감 시간 안에 토큰을 얻을 수 없으면 기다리지 않고 실패
+            remaining: Optional[float] = self.request_timeout(default=float("inf"))
+            if remaining is None or not limiter.acquire(None if remaining == float("inf") else remaining):
+                return {
+                    "ok": False,
+                    "error": "deadline_exceeded",
+                    "message": f"도구 호출 마감 시간 안에 {endpoint} 속도 제한을 통과할 수 없습니다."
+                }
+            
+            result = self.make_request(endpoint, method=method, data=data, use_user_token=use_user_token)
+            
+            if result.get("error") != "ratelimited":
+                break
+            
+            # 마감 시간 안에 재시도할 수 없으면 포기
+            retry_after: float = result.get("retry_after", 1)
+            remaining = self.request_timeout(default=float("inf"))
+            if remaining is None or remaining <= retry_after:
+                break
+            time.sleep(retry_after)
+        
+        return result
+    
+    def fetch_all_pages(
+        self, 
+        endpoint: str, 
+        collection_key: str, 
+        data: Optional[Dict[str, Any]] = None, 
+        page_size: int = 200
+    ) -> Dict[str, Any]:
+        """
+        커서 기반 페이지네이션 API의 모든 페이지를 조회하여 하나로 합칩니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            collection_key (str): 응답에서 항목 목록이 담긴 키 (예: "members", "channels")
+            data (Optional[Dict[str, Any]]): 추가 요청 데이터
+            page_size (int): 페이지당 조회할 항목 수 (기본값: 200)
+        
+        Returns:
+            Dict[str, Any]: {"ok": ..., collection_key: 전체 항목 목록} 형태의 API 응답
+        """
+        items: List[Any] = []
+        
+        for result in self.iter_pages(endpoint, data, page_size):
+            if not result.get("ok"):
+                return result
+            items.extend(result.get(collection_key, []))
+        
+        return {"ok": True, collection_key: items}
+    
+    def iter_pages(
+        self, 
+        endpoint: str, 
+        data: Optional[Dict[str, Any]] = None, 
+        page_size: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        커서 기반 페이지네이션 API의 응답을 한 페이지씩 내보냅니다.
+        실패한 응답을 내보낸 뒤에는 중단합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트
+            data (Optional[Dict[str, Any]]): 추가 요청 데이터
+            page_size (int): 페이지당 조회할 항목 수 (기본값: 200)
+        
+        Returns:
+            Iterator[Dict[str, Any]]: 페이지별 API 응답
+        """
+        cursor: str = ""
+        
+        while True:
+            page_data: Dict[str, Any] = dict(data or {})
+            page_data["limit"] = page_size
+            if cursor:
+                page_data["cursor"] = cursor
+            
+            result: Dict[str, Any] = self.rate_limited_request(endpoint, data=page_data)
+            yield result
+            
+            if not result.get("ok"):
+                return
+            
+            cursor = result.get("response_metadata", {}).get("next_cursor", "")
+            if not cursor:
+                return
+    
+    def _submit(self, fn: Any, *args: Any, **kwargs: Any) -> Future:
+        """
+        워커 풀에 작업을 제출합니다 (현재 컨텍스트의 마감 시간 유지).
+        
+        Args:
+            fn (Any): 실행할 함수
+            *args (Any): 함수 인자
+            **kwargs (Any): 함수 키워드 인자
+        
+        Returns:
+            Future: 작업 결과를 담을 Future
+        """
+        # 도구 호출의 마감 시간이 워커 스레드에도 적용되도록 컨텍스트를 복사
+        context: contextvars.Context = contextvars.copy_context()
+        return self._executor.submit(context.run, fn, *args, **kwargs)
+    
+    def send_message(self, channel: str, text: str, coalesce: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        지정된 Slack 채널에 메시지를 전송합니다.
+        아웃박스 모드에서는 같은 채널로 짧은 시간 안에 들어온 메시지들을 하나로 병합해 전송하고,
+        병합된 모든 호출자에게 같은 타임스탬프를 반환합니다.
+        
+        Args:
+            channel (str): 채널 ID 또는 채널명 (예: #general, C1234567890)
+            text (str): 전송할 메시지 내용 (UTF-8 인코딩 한글 지원)
+            coalesce (Optional[bool]): 아웃박스 병합 사용 여부 (기본값: SLACK_OUTBOX_WINDOW 설정을 따름)
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        return self.queue_message(channel, text, coalesce).result()
+    
+    def queue_message(self, channel: str, text: str, coalesce: Optional[bool] = None) -> Future:
+        """
+        send_message와 같지만 아웃박스 병합 전송을 기다리지 않고 결과를 담을 Future를 바로 반환합니다.
+        (호출한 스레드가 병합 대기 시간 동안 묶이지 않도록)
+        
+        Args:
+            channel (str): 채널 ID 또는 채널명 (예: #general, C1234567890)
+            text (str): 전송할 메시지 내용
+            coalesce (Optional[bool]): 아웃박스 병합 사용 여부 (기본값: SLACK_OUTBOX_WINDOW 설정을 따름)
+        
+        Returns:
+            Future: send_message 결과(Dict[str, Any])를 담을 Future
+        """
+        # 디렉토리가 캐시되어 있으면 채널명을 ID로 변환 (없으면 Slack이 채널명을 그대로 처리)
+        resolved: Dict[str, Any] = self.resolve_entity_id(channel, "channel", load=False)
+        if resolved.get("success"):
+            channel = resolved["id"]
+        
+        if coalesce is None:
+            coalesce = self.outbox_window > 0
+        
+        caller_result: Future = Future()
+        if not coalesce or len(text) > OUTBOX_MAX_TEXT_LENGTH:
+            caller_result.set_result(self._post_message(channel, text))
+            return caller_result
+        
+        full_batch: Optional[OutboxBatch] = None
+        
+        with self._outbox_lock:
+            batch: Optional[OutboxBatch] = self._outbox.get(channel)
+            
+            # 최대 길이를 넘으면 기존 묶음은 즉시 전송하고 새 묶음을 시작
+            if batch is not None and not batch.fits(text):
+                full_batch = self._outbox.pop(channel)
+                full_batch.flushed = True
+                batch = None
+            
+            if batch is None:
+                batch = OutboxBatch()
+                batch.timer = threading.Timer(self.outbox_window, self._flush_outbox_batch, (channel, batch))
+                batch.timer.daemon = True
+                self._outbox[channel] = batch
+                batch.timer.start()
+            
+            batch.add(text)
+            merged_index: int = len(batch.texts) - 1
+        
+        if full_batch is not None:
+            if full_batch.timer:
+                full_batch.timer.cancel()
+            self._send_outbox_batch(channel, full_batch)
+        
+        sent_batch: OutboxBatch = batch
+        
+        def deliver(batch_result: Future) -> None:
+            result: Dict[str, Any] = dict(batch_result.result())
+            if result.get("success"):
+                result["merged_count"] = len(sent_batch.texts)
+                result["merged_index"] = merged_index
+            caller_result.set_result(result)
+        
+        batch.result.add_done_callback(deliver)
+        return caller_result
+    
+    def flush_outbox(self) -> None:
+        """
+        아웃박스에 대기 중인 모든 채널의 메시지를 즉시 전송합니다.
+        """
+        with self._outbox_lock:
+            batches: List[Tuple[str, OutboxBatch]] = list(self._outbox.items())
+            self._outbox.clear()
+            for _, batch in batches:
+                batch.flushed = True
+        
+        for channel, batch in batches:
+            if batch.timer:
+                batch.timer.cancel()
+            self._send_outbox_batch(channel, batch)
+    
+    def _flush_outbox_batch(self, channel: str, batch: OutboxBatch) -> None:
+        """
+        병합 대기 시간이 끝난 묶음을 전송합니다 (타이머 콜백).
+        
+        Args:
+            channel (str): 채널 ID 또는 채널명
+            batch (OutboxBatch): 전송할 메시지 묶음
+        """
+        with self._outbox_lock:
+            if batch.flushed:
+                return
+            batch.flushed = True
+            if self._outbox.get(channel) is batch:
+                del self._outbox[channel]
+        
+        self._send_outbox_batch(channel, batch)
+    
+    def _send_outbox_batch(self, channel: str, batch: OutboxBatch) -> None:
+        """
+        메시지 묶음을 하나의 메시지로 합쳐 전송하고 대기 중인 호출자들을 깨웁니다.
+        
+        Args:
+            channel (str): 채널 ID 또는 채널명
+            batch (OutboxBatch): 전송할 메시지 묶음
+        """
+        try:
+            result: Dict[str, Any] = self._post_message(channel, "\n".join(batch.texts))
+        except Exception as e:
+            result = {
+                "success": False,
+                "error": f"메시지 전송 중 오류가 발생했습니다: {str(e)}"
+            }
+        batch.result.set_result(result)
+    
+    def _post_message(self, channel: str, text: str) -> Dict[str, Any]:
+        """
+        chat.postMessage로 메시지 하나를 전송합니다.
+        
+        Args:
+            channel (str): 채널 ID 또는 채널명
+            text (str): 전송할 메시지 내용
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        data: Dict[str, str] = {
+            "channel": channel,
+            "text": text
+        }
+        
+        result: Dict[str, Any] = self.make_request("chat.postMessage", method="POST", data=data)
+        
+        if result.get("ok"):
+            return {
+                "success": True,
+                "message": "메시지가 성공적으로 전송되었습니다.",
+                "timestamp": result.get("ts"),
+                "channel": result.get("channel")
+            }
+        else:
+            return {
+                "success": False,
+                "error": result.get("error", "알 수 없는 오류가 발생했습니다."),
+                "details": result
+            }
+    
+    def get_channels(self) -> Dict[str, Any]:
+        """
+        접근 가능한 모든 Slack 채널 목록을 조회합니다.
+        조회 결과는 이름 → ID 인덱스에 사용할 채널 디렉토리 캐시에도 저장됩니다.
+        
+        Returns:
+            Dict[str, Any]: 채널 목록과 정보 (채널 ID, 이름, 공개/비공개 여부, 멤버십 상태)
+        """
+        channels, complete = self._fetch_channel_directory()
+        
+        if complete:
+            with self._directory_lock:
+                # 캐시가 있으면 바뀐 채널만 인덱스와 관련 캐시에 반영 (재구성 없이)
+                if self._channels_directory is not None:
+                    self._apply_directory_changes("channel", self._diff_channels(channels))
+                self._channels_directory = channels
+                self._channels_fetched_at = time.time()
+                self._snapshot_dirty = True
+        
+        return {
+            "success": True,
+            "total_channels": len(channels),
+            "channels": channels
+        }
+    
+    def _fetch_channel_directory(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        공개/비공개 채널 목록을 모두 조회합니다.
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: (채널 목록, 두 조회가 모두 성공했는지 여부)
+        """
+        # 공개 채널 조회
+        public_channels: Dict[str, Any] = self.fetch_all_pages(
+            "conversations.list", 
+            "channels", 
+            data={"types": "public_channel"}, 
+            page_size=DIRECTORY_PAGE_SIZE
+        )
+        
+        # 비공개 채널 조회  
+        private_channels: Dict[str, Any] = self.fetch_all_pages(
+            "conversations.list", 
+            "channels", 
+            data={"types": "private_channel"}, 
+            page_size=DIRECTORY_PAGE_SIZE
+        )
+        
+        channels: List[Dict[str, Any]] = []
+        
+        # 공개 채널 처리
+        if public_channels.get("ok"):
+            for channel in public_channels.get("channels", []):
+                channels.append(self._format_channel(channel, is_private=False))
+        
+        # 비공개 채널 처리
+        if private_channels.get("ok"):
+            for channel in private_channels.get("channels", []):
+                channels.append(self._format_channel(channel, is_private=True))
+        
+        return channels, bool(public_channels.get("ok") and private_channels.get("ok"))
+    
+    @staticmethod
+    def _format_channel(channel: Dict[str, Any], is_private: bool) -> Dict[str, Any]:
+        """
+        conversations.list의 채널 객체를 응답 형식으로 변환합니다.
+        
+        Args:
+            channel (Dict[str, Any]): Slack 채널 객체
+            is_private (bool): 비공개 채널 여부
+        
+        Returns:
+            Dict[str, Any]: 채널 ID, 이름, 공개/비공개 여부, 멤버십 상태, 주제, 목적
+        """
+        return {
+            "id": channel["id"],
+            "name": channel["name"],
+            "is_private": is_private,
+            "is_member": channel.get("is_member", False),
+            "topic": channel.get("topic", {}).get("value", ""),
+            "purpose": channel.get("purpose", {}).get("value", "")
+        }
+    
+    def get_channel_history(self, channel_id: str, limit: int = 10) -> Dict[str, Any]:
+        """
+        지정된 채널의 최근 메시지 히스토리를 조회합니다.
+        
+        Args:
+            channel_id (str): 조회할 채널의 ID
+            limit (int): 조회할 메시지 수 (기본값: 10, 최대: 100)
+        
+        Returns:
+            Dict[str, Any]: 메시지 히스토리 (메시지 내용, 작성자, 타임스탬프)
+        """
+        # limit 값 검증
+        if limit > 100:
+            limit = 100
+        elif limit < 1:
+            limit = 1
+        
+        data: Dict[str, Union[str, int]] = {
+            "channel": channel_id,
+            "limit": limit
+        }
+        
+        result: Dict[str, Any] = self.make_request("conversations.history", data=data)
+        
+        if not result.get("ok"):
+            return {
+                "success": False,
+                "error": result.get("error", "메시지 히스토리를 가져올 수 없습니다."),
+                "details": result
+            }
+        
+        messages: List[Dict[str, Any]] = []
+        for msg in result.get("messages", []):
+            # 사용자 정보 조회
+            user_info: Optional[Dict[str, Any]] = None
+            if msg.get("user"):
+                user_response: Dict[str, Any] = self.make_request("users.info", data={"user": msg["user"]})
+                if user_response.get("ok"):
+                    user_info = user_response.get("user", {})
+            
+            message_data: Dict[str, Any] = {
+                "text": msg.get("text", ""),
+                "user_id": msg.get("user", ""),
+                "user_name": user_info.get("real_name", "") if user_info else "",
+                "timestamp": msg.get("ts", ""),
+                "type": msg.get("type", ""),
+                "subtype": msg.get("subtype", "")
+            }
+            
+            # 스레드 정보가 있는 경우
+            if msg.get("thread_ts"):
+                message_data["is_thread_reply"] = True
+                message_data["thread_timestamp"] = msg.get("thread_ts")
+            
+            messages.append(message_data)
+        
+        return {
+            "success": True,
+            "channel_id": channel_id,
+            "message_count": len(messages),
+            "messages": messages
+        }
+    
+    def analyze_channel_activity(
+        self, 
+        channel_id: str, 
+        oldest: str = "", 
+        latest: str = "", 
+        utc_offset_hours: float = 0.0, 
+        top_n: int = 10, 
+        incremental: bool = True
+    ) -> Dict[str, Any]:
+        """
+        채널 히스토리를 한 번 훑으면서 활동 통계만 집계합니다.
+        메시지 원문 대신 사용자별 메시지 수, 시간대/요일/일별 히스토그램,
+        스레드 비율, 상위 반응자 같은 압축된 결과만 반환합니다.
+        
+        같은 채널/시작 시점/시간대로 다시 호출하면 저장된 워터마크 이후의
+        새 메시지만 조회하여 기존 집계에 더합니다 (latest를 지정하지 않은 경우).
+        이미 집계된 메시지에 나중에 달린 답글/반응은 반영되지 않습니다.
+        
+        마감 시간 초과 등으로 조회가 중간에 멈추면 그때까지의 집계를 complete: false로 반환하고,
+        증분 모드에서는 아직 못 읽은 오래된 구간을 저장해 다음 호출에서 이어서 집계합니다.
+        
+        Args:
+            channel_id (str): 분석할 채널의 ID 또는 채널명
+            oldest (str): 시작 시점 (Slack ts 또는 "YYYY-MM-DD", 기본값: 전체)
+            latest (str): 끝 시점 (Slack ts 또는 "YYYY-MM-DD", 기본값: 현재)
+            utc_offset_hours (float): 시간대 히스토그램의 UTC 오프셋 (예: KST는 9)
+            top_n (int): 상위 사용자/반응자/이모지 수 (기본값: 10)
+            incremental (bool): 저장된 워터마크부터 증분 계산할지 여부 (기본값: True)
+        
+        Returns:
+            Dict[str, Any]: 채널 활동 통계
+        """
+        resolved: Dict[str, Any] = self.resolve_entity_id(channel_id, "channel")
+        if not resolved.get("success"):
+            return resolved
+        channel_id = resolved["id"]
+        
+        try:
+            oldest_ts: str = self._to_slack_ts(oldest, utc_offset_hours)
+            latest_ts: str = self._to_slack_ts(latest, utc_offset_hours)
+        except ValueError:
+            return {
+                "success": False,
+                "error": "oldest/latest는 Slack 타임스탬프 또는 YYYY-MM-DD 형식이어야 합니다."
+            }
+        
+        state_path: str = self._analytics_state_path(channel_id, oldest_ts, utc_offset_hours)
+        use_state: bool = incremental and not latest_ts
+        
+        stats: Optional[ChannelActivityStats] = None
+        if use_state and os.path.exists(state_path):
+            try:
+                with open(state_path, "r", encoding="utf-8") as state_file:
+                    stats = ChannelActivityStats.from_state(json.load(state_file))
+            except (OSError, ValueError):
+                stats = None
+        
+        resumed_from: str = stats.watermark if stats else ""
+        if stats is None:
+            stats = ChannelActivityStats(utc_offset_hours)
+        
+        # 조회할 구간 (oldest, latest): 이전에 끝내지 못한 오래된 구간을 먼저, 그다음 새 메시지
+        # (oldest는 배타적이므로 워터마크 메시지는 다시 세지 않음)
+        ranges: List[Tuple[str, str]] = []
+        if stats.resume_latest:
+            ranges.append((stats.resume_oldest, stats.resume_latest))
+        ranges.append((resumed_from or oldest_ts, latest_ts))
+        
+        pages: int = 0
+        new_messages: int = 0
+        failure: Optional[Dict[str, Any]] = None
+        
+        for range_oldest, range_latest in ranges:
+            history_data: Dict[str, Any] = {"channel": channel_id}
+            if range_oldest:
+                history_data["oldest"] = range_oldest
+            if range_latest:
+                history_data["latest"] = range_latest
+            
+            # conversations.history는 최신 메시지부터 반환하므로, 지금까지 읽은 가장 오래된 ts 아래가 남은 구간
+            lowest_ts: str = ""
+            for page in self.iter_pages("conversations.history", history_data, page_size=200):
+                if not page.get("ok"):
+                    failure = page
+                    break
+                
+                page_messages: List[Dict[str, Any]] = page.get("messages", [])
+                stats.add_all(page_messages)
+                new_messages += len(page_messages)
+                pages += 1
+                for message in page_messages:
+                    ts: str = message.get("ts", "")
+                    if ts and (not lowest_ts or float(ts) < float(lowest_ts)):
+                        lowest_ts = ts
+            
+            if failure is not None:
+                stats.resume_oldest = range_oldest
+                stats.resume_latest = lowest_ts or range_latest
+                break
+            stats.resume_oldest = stats.resume_latest = ""
+        
+        if failure is not None and not pages and not resumed_from:
+            return {
+                "success": False,
+                "error": failure.get("error", "메시지 히스토리를 가져올 수 없습니다."),
+                "pages_processed": pages,
+                "details": failure
+            }
+        
+        if use_state:
+            try:
+                os.makedirs(os.path.dirname(state_path), exist_ok=True)
+                with open(state_path, "w", encoding="utf-8") as state_file:
+                    json.dump(stats.to_state(), state_file, ensure_ascii=False, separators=(",", ":"))
+            except OSError as e:
+                logger.warning("채널 분석 상태를 저장하지 못했습니다 (%s): %s", state_path, e)
+        
+        # 디렉토리가 캐시되어 있으면 사용자 이름도 포함
+        names: Dict[str, str] = {}
+        index: Optional[EntityIndex] = self.get_entity_index(load=False)
+        if index is not None:
+            for user_id in list(stats.user_counts) + list(stats.reactor_counts):
+                entity: Optional[Dict[str, Any]] = index.get(user_id)
+                if entity:
+                    names[user_id] = entity.get("real_name") or entity.get("name", "")
+        
+        return {
+            "success": True,
+            "channel_id": channel_id,
+            "oldest": oldest_ts,
+            "latest": latest_ts,
+            "utc_offset_hours": utc_offset_hours,
+            "incremental": bool(resumed_from),
+            "complete": failure is None,
+            "incomplete_reason": failure.get("error", "") if failure is not None else "",
+            "watermark": stats.watermark,
+            "pages_fetched": pages,
+            "new_messages_processed": new_messages,
+            **stats.summary(top_n, names)
+        }
+    
+    @staticmethod
+    def _to_slack_ts(value: str, utc_offset_hours: float = 0.0) -> str:
+        """
+        "YYYY-MM-DD" 날짜 또는 Slack ts를 Slack ts 문자열로 변환합니다.
+        
+        Args:
+            value (str): 날짜 또는 Slack ts (빈 문자열이면 그대로 반환)
+            utc_offset_hours (float): 날짜를 해석할 UTC 오프셋
+        
+        Returns:
+            str: Slack ts 문자열
+        
+        Raises:
+            ValueError: 형식이 올바르지 않은 경우
+        """
+        value = value.strip()
+        if not value:
+            return ""
+        if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+            day: datetime.datetime = datetime.datetime.strptime(value, "%Y-%m-%d").replace(
+                tzinfo=datetime.timezone(datetime.timedelta(hours=utc_offset_hours))
+            )
+            return f"{day.timestamp():.6f}"
+        return f"{float(value):.6f}"
+    
+    @staticmethod
+    def _analytics_state_path(channel_id: str, oldest_ts: str, utc_offset_hours: float) -> str:
+        """
+        채널 분석 증분 상태를 저장할 파일 경로를 반환합니다.
+        
+        Args:
+            channel_id (str): 채널 ID
+            oldest_ts (str): 집계 시작 시점
+            utc_offset_hours (float): UTC 오프셋
+        
+        Returns:
+            str: 상태 파일 경로 (SLACK_ANALYTICS_DIR 아래)
+        """
+        state_key: str = hashlib.sha256(f"{oldest_ts}|{utc_offset_hours}".encode("utf-8")).hexdigest()[:12]
+        return os.path.join(
+            os.getenv("SLACK_ANALYTICS_DIR", os.path.join(CACHE_DIR, "analytics")), 
+            f"{channel_id}_{state_key}.json"
+        )
+    
+    def send_direct_message(self, user_id: str, text: str, coalesce: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        특정 사용자에게 1:1 다이렉트 메시지를 전송합니다.
+        
+        Args:
+            user_id (str): 메시지를 받을 사용자의 ID 또는 이름 (예: U0123456789, @pepe, 이메일)
+            text (str): 전송할 메시지 내용
+            coalesce (Optional[bool]): 아웃박스 병합 사용 여부 (기본값: SLACK_OUTBOX_WINDOW 설정을 따름)
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        return self.queue_direct_message(user_id, text, coalesce).result()
+    
+    def queue_direct_message(self, user_id: str, text: str, coalesce: Optional[bool] = None) -> Future:
+        """
+        send_direct_message와 같지만 아웃박스 병합 전송을 기다리지 않고 Future를 바로 반환합니다.
+        
+        Args:
+            user_id (str): 메시지를 받을 사용자의 ID 또는 이름
+            text (str): 전송할 메시지 내용
+            coalesce (Optional[bool]): 아웃박스 병합 사용 여부 (기본값: SLACK_OUTBOX_WINDOW 설정을 따름)
+        
+        Returns:
+            Future: send_direct_message 결과(Dict[str, Any])를 담을 Future
+        """
+        failed: Future = Future()
+        
+        resolved: Dict[str, Any] = self.resolve_entity_id(user_id, "user")
+        if not resolved.get("success"):
+            failed.set_result(resolved)
+            return failed
+        user_id = resolved["id"]
+        
+        dm_channel_result: Dict[str, Any] = self.open_dm_channel(user_id)
+        
+        if not dm_channel_result.get("success"):
+            failed.set_result(dm_channel_result)
+            return failed
+        
+        dm_channel_id: str = dm_channel_result["channel"]
+        
+        # 메시지 전송
+        return self.queue_message(dm_channel_id, text, coalesce)
+    
+    def open_dm_channel(self, user_id: str) -> Dict[str, Any]:
+        """
+        사용자와의 DM 채널 ID를 반환합니다 (캐시 사용, 없으면 conversations.open 호출).
+        
+        Args:
+            user_id (str): 사용자 ID
+        
+        Returns:
+            Dict[str, Any]: DM 채널 ID 또는 오류
+        """
+        self._load_snapshot()
+        
+        with self._directory_lock:
+            cached_channel_id: Optional[str] = self._dm_channels.get(user_id)
+        if cached_channel_id:
+            return {"success": True, "channel": cached_channel_id}
+        
+        # DM 채널 열기
+        dm_open_data: Dict[str, str] = {"users": user_id}
+        dm_channel_result: Dict[str, Any] = self.make_request("conversations.open", method="POST", data=dm_open_data)
+        
+        if not dm_channel_result.get("ok"):
+            return {
+                "success": False,
+                "error": f"DM 채널을 열 수 없습니다: {dm_channel_result.get('error', '알 수 없는 오류')}",
+                "details": dm_channel_result
+            }
+        
+        # DM 채널 ID 가져오기
+        dm_channel_id: str = dm_channel_result.get("channel", {}).get("id", "")
+        
+        if not dm_channel_id:
+            return {
+                "success": False,
+                "error": "DM 채널 ID를 가져올 수 없습니다.",
+                "details": dm_channel_result
+            }
+        
+        with self._directory_lock:
+            self._dm_channels[user_id] = dm_channel_id
+            self._snapshot_dirty = True
+        
+        return {"success": True, "channel": dm_channel_id}
+    
+    def invite_user_to_channel(self, channel_id: str, user_id: str) -> Dict[str, Any]:
+        """
+        지정된 채널에 사용자를 초대합니다.
+        
+        Args:
+            channel_id (str): 초대할 채널의 ID 또는 채널명 (예: C1234567890, #general)
+            user_id (str): 초대할 사용자의 ID 또는 이름 (예: U0123456789, @pepe, 이메일)
+        
+        Returns:
+            Dict[str, Any]: API 응답 결과
+        """
+        resolved_channel: Dict[str, Any] = self.resolve_entity_id(channel_id, "channel")
+        if not resolved_channel.get("success"):
+            return resolved_channel
+        resolved_user: Dict[str, Any] = self.resolve_entity_id(user_id, "user")
+        if not resolved_user.get("success"):
+            return resolved_user
+        channel_id, user_id = resolved_channel["id"], resolved_user["id"]
+        
+        data: Dict[str, str] = {
+            "channel": channel_id,
+            "users": user_id
+        }
+        
+        result: Dict[str, Any] = self.make_request("conversations.invite", method="POST", data=data)
+        
+        if result.get("ok"):
+            self._remember_channel_members(channel_id, [user_id])
+            return {
+                "success": True,
+                "message": "사용자가 성공적으로 채널에 초대되었습니다.",
+                "channel": channel_id,
+                "user": user_id
+            }
+        else:
+            return {
+                "success": False,
+                "error": result.get("error", "사용자 초대에 실패했습니다."),
+                "details": result
+            }
+    
+    def get_channel_members(self, channel_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        채널에 참여 중인 사용자 ID 목록을 조회합니다.
+        CHANNEL_MEMBERS_TTL 안에 조회한 목록이 있으면 캐시를 사용합니다.
+        
+        Args:
+            channel_id (str): 조회할 채널의 ID
+            refresh (bool): 캐시를 무시하고 다시 조회할지 여부 (기본값: False)
+        
+        Returns:
+            Dict[str, Any]: 채널 멤버 ID 목록 (cached: 캐시 사용 여부)
+        """
+        with self._channel_members_lock:
+            cached: Optional[Set[str]] = self._channel_members.get(channel_id)
+            cache_age: float = time.time() - self._channel_members_fetched_at.get(channel_id, 0.0)
+            if cached is not None and not refresh and cache_age < CHANNEL_MEMBERS_TTL:
+                return {
+                    "success": True,
+                    "channel_id": channel_id,
+                    "member_count": len(cached),
+                    "members": sorted(cached),
+                    "cached": True
+                }
+        
+        result: Dict[str, Any] = self.fetch_all_pages(
+            "conversations.members", 
+            "members", 
+            data={"channel": channel_id}, 
+            page_size=1000
+        )
+        
+        if not result.get("ok"):
+            return {
+                "success": False,
+                "error": result.get("error", "채널 멤버 목록을 가져올 수 없습니다."),
+                "details": result
+            }
+        
+        members: Set[str] = set(result.get("members", []))
+        with self._channel_members_lock:
+            self._channel_members[channel_id] = members
+            self._channel_members_fetched_at[channel_id] = time.time()
+        
+        return {
+            "success": True,
+            "channel_id": channel_id,
+            "member_count": len(members),
+            "members": sorted(members),
+            "cached": False
+        }
+    
+    def _remember_channel_members(self, channel_id: str, user_ids: List[str]) -> None:
+        """
+        초대에 성공한 사용자를 채널 멤버 캐시에 반영합니다.
+        
+        Args:
+            channel_id (str): 채널 ID
+            user_ids (List[str]): 채널에 추가된 사용자 ID 목록
+        """
+        with self._channel_members_lock:
+            members: Optional[Set[str]] = self._channel_members.get(channel_id)
+            if members is not None:
+                members.update(user_ids)
+    
+    def invite_users_to_channels(self, channel_ids: List[str], user_ids: List[str]) -> Dict[str, Any]:
+        """
+        여러 사용자를 여러 채널에 한 번에 초대합니다.
+        채널들은 워커 풀에서 병렬로 처리하고, 채널마다 사용자를 최대 1000명씩 묶어
+        conversations.invite를 호출합니다. 이미 채널에 있는 사용자는 건너뜁니다.
+        
+        Args:
+            channel_ids (List[str]): 초대할 채널 ID 또는 채널명 목록
+            user_ids (List[str]): 초대할 사용자 ID 또는 이름 목록
+        
+        Returns:
+            Dict[str, Any]: 채널별 초대/건너뜀/실패 사용자 결과
+        """
+        unresolved: List[Dict[str, Any]] = []
+        
+        def resolve_all(values: List[str], entity_type: str) -> List[str]:
+            resolved_ids: List[str] = []
+            for value in values:
+                if not value.strip():
+                    continue
+                resolved: Dict[str, Any] = self.resolve_entity_id(value, entity_type)
+                if resolved.get("success"):
+                    resolved_ids.append(resolved["id"])
+                else:
+                    unresolved.append({"value": value, "type": entity_type, "error": resolved.get("error", "")})
+            # 입력 순서를 유지하면서 중복 제거
+            return list(dict.fromkeys(resolved_ids))
+        
+        unique_channels: List[str] = resolve_all(channel_ids, "channel")
+        unique_users: List[str] = resolve_all(user_ids, "user")
+        
+        futures: List[Future] = [
+            self._submit(self._invite_users_to_channel_chunked, channel_id, unique_users)
+            for channel_id in unique_channels
+        ]
+        results: List[Dict[str, Any]] = [future.result() for future in futures]
+        
+        invited_count: int = sum(len(result["invited"]) for result in results)
+        skipped_count: int = sum(len(result["skipped"]) for result in results)
+        failed_count: int = sum(len(result["failed"]) for result in results) + len(unresolved)
+        
+        return {
+            "success": failed_count == 0,
+            "message": f"{len(unique_channels)}개 채널에 {invited_count}건 초대, {skipped_count}건 건너뜀, {failed_count}건 실패",
+            "invited_count": invited_count,
+            "skipped_count": skipped_count,
+            "failed_count": failed_count,
+            "unresolved": unresolved,
+            "channels": results
+        }
+    
+    def _invite_users_to_channel_chunked(self, channel_id: str, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        한 채널에 사용자들을 묶음 단위로 초대합니다.
+        
+        Args:
+            channel_id (str): 초대할 채널의 ID
+            user_ids (List[str]): 초대할 사용자 ID 목록
+        
+        Returns:
+            Dict[str, Any]: 초대/건너뜀/실패 사용자 목록
+        """
+        invited: List[str] = []
+        skipped: List[str] = []
+        failed: List[Dict[str, str]] = []
+        
+        members_result: Dict[str, Any] = self.get_channel_members(channel_id)
+        if members_result.get("cached") and not set(user_ids).isdisjoint(members_result.get("members", [])):
+            # 캐시 이후 채널을 나간 사용자를 건너뛰지 않도록 최신 목록으로 다시 확인
+            members_result = self.get_channel_members(channel_id, refresh=True)
+        if not members_result.get("success"):
+            return {
+                "channel": channel_id,
+                "success": False,
+                "invited": invited,
+                "skipped": skipped,
+                "failed": [
+                    {"user": user_id, "error": members_result.get("error", "")} for user_id in user_ids
+                ]
+            }
+        
+        members: Set[str] = set(members_result.get("members", []))
+        pending: List[str] = []
+        for user_id in user_ids:
+            if user_id in members:
+                skipped.append(user_id)
+            else:
+                pending.append(user_id)
+        
+        for start in range(0, len(pending), INVITE_USERS_PER_REQUEST):
+            chunk: List[str] = pending[start:start + INVITE_USERS_PER_REQUEST]
+            result: Dict[str, Any] = self.rate_limited_request(
+                "conversations.invite", 
+                method="POST", 
+                data={"channel": channel_id, "users": ",".join(chunk), "force": True}
+            )
+            
+            # force=True이면 잘못된 사용자만 errors에 담기고 나머지는 초대됨
+            user_errors: Dict[str, str] = {
+                error.get("user", ""): error.get("error", "")
+                for error in result.get("errors", [])
+                if error.get("user")
+            }
+            
+            for user_id in chunk:
+                error: Optional[str] = user_errors.get(user_id)
+                if error is None and not result.get("ok"):
+                    error = result.get("error", "사용자 초대에 실패했습니다.")
+                
+                if error is None:
+                    invited.append(user_id)
+                elif error == "already_in_channel":
+                    skipped.append(user_id)
+                else:
+                    failed.append({"user": user_id, "error": error})
+        
+        self._remember_channel_members(channel_id, invited + skipped)
+        
+        return {
+            "channel": channel_id,
+            "success": not failed,
+            "invited": invited,
+            "skipped": skipped,
+            "failed": failed
+        }
+    
+    def get_users(self) -> Dict[str, Any]:
+        """
+        워크스페이스의 모든 사용자 목록을 조회합니다.
+        조회 결과는 이름 → ID 인덱스에 사용할 사용자 디렉토리 캐시에도 저장됩니다.
+        
+        Returns:
+            Dict[str, Any]: 사용자 목록과 정보 (사용자 ID, 이름, 이메일, 프로필 등)
+        """
+        result: Dict[str, Any] = self.fetch_all_pages("users.list", "members", page_size=DIRECTORY_PAGE_SIZE)
+        
+        if not result.get("ok"):
+            return {
+                "success": False,
+                "error": result.get("error", "사용자 목록을 가져올 수 없습니다."),
+                "details": result
+            }
+        
+        users: List[Dict[str, Any]]
+        with self._directory_lock:
+            if self._users_directory is None:
+                # 삭제된 사용자는 제외
+                users = [
+                    self._format_user(user) for user in result.get("members", []) 
+                    if not user.get("deleted", False)
+                ]
+            else:
+                # 캐시가 있으면 바뀐 사용자만 인덱스와 관련 캐시에 반영 (재구성 없이)
+                user_changes: Dict[str, List[Dict[str, Any]]]
+                user_changes, users = self._diff_users(result.get("members", []))
+                self._apply_directory_changes("user", user_changes)
+            
+            self._users_directory = users
+            self._users_fetched_at = time.time()
+            self._snapshot_dirty = True
+        
+        return {
+            "success": True,
+            "total_users": len(users),
+            "users": users
+        }
+    
+    @staticmethod
+    def _format_user(user: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        users.list의 사용자 객체를 응답 형식으로 변환합니다.
+        
+        Args:
+            user (Dict[str, Any]): Slack 사용자 객체
+        
+        Returns:
+            Dict[str, Any]: 사용자 ID, 이름, 이메일, 프로필 등
+        """
+        return {
+            "id": user["id"],
+            "name": user.get("name", ""),
+            "real_name": user.get("real_name", ""),
+            "display_name": user.get("profile", {}).get("display_name", ""),
+            "email": user.get("profile", {}).get("email", ""),
+            "is_bot": user.get("is_bot", False),
+            "is_admin": user.get("is_admin", False),
+            "is_owner": user.get("is_owner", False),
+            "status": user.get("profile", {}).get("status_text", ""),
+            "timezone": user.get("tz", ""),
+            "image_url": user.get("profile", {}).get("image_72", ""),
+            "updated": user.get("updated", 0)
+        }
+    
+    def refresh_directory(self, mode: str = "delta") -> Dict[str, Any]:
+        """
+        사용자/채널 디렉토리를 새로 고치고 추가/변경/삭제 변경 내역을 반환합니다.
+        
+        delta 모드에서는 사용자의 updated 타임스탬프와 채널 정보 비교로 바뀐 항목만 찾아
+        디렉토리 캐시, 이름 → ID 인덱스, 채널 멤버/DM 캐시에 증분 반영합니다.
+        (Slack API에 변경분 조회 기능이 없어 목록 자체는 전체 페이지를 조회합니다.)
+        
+        Args:
+            mode (str): "delta" (증분 반영) 또는 "full" (전체 재구성) 기본값: "delta"
+        
+        Returns:
+            Dict[str, Any]: 사용자/채널별 added, modified, removed 변경 내역
+                - 항목별 최대 CHANGELOG_MAX_ENTRIES개까지 담고, 개수는 *_count로 보고합니다.
+                - 이전 디렉토리가 없었으면 변경 내역 대신 baseline: true와 전체 개수만 반환합니다.
+        """
+        if mode == "full":
+            users_result: Dict[str, Any] = self.get_users()
+            channels_result: Dict[str, Any] = self.get_channels()
+            with self._directory_lock:
+                # 다음 조회 때 인덱스를 처음부터 다시 생성
+                self._entity_index = None
+            return {
+                "success": bool(users_result.get("success")),
+                "mode": "full",
+                "total_users": users_result.get("total_users", 0),
+                "total_channels": channels_result.get("total_channels", 0)
+            }
+        
+        if mode != "delta":
+            return {
+                "success": False,
+                "error": f"지원하지 않는 모드입니다: {mode} (delta 또는 full)"
+            }
+        
+        self._load_snapshot()
+        
+        members_result: Dict[str, Any] = self.fetch_all_pages("users.list", "members", page_size=DIRECTORY_PAGE_SIZE)
+        if not members_result.get("ok"):
+            return {
+                "success": False,
+                "error": members_result.get("error", "사용자 목록을 가져올 수 없습니다."),
+                "details": members_result
+            }
         
-        if not self.bot_token:
-            raise ValueError("SLACK_BOT_TOKEN 환경변수가 설정되지 않았습니다.")
+        channels, channels_complete = self._fetch_channel_directory()
         
-        self.base_url: str = "https://slack.com/api"
+        with self._directory_lock:
+            # 이전 디렉토리가 없으면 모든 항목이 "추가"이므로 변경 내역 대신 기준선으로 보고
+            users_baseline: bool = self._users_directory is None
+            channels_baseline: bool = self._channels_directory is None
+            user_changes, users = self._diff_users(members_result.get("members", []))
+            self._users_directory = users
+            self._users_fetched_at = time.time()
+            self._apply_directory_changes("user", user_changes)
+            
+            channel_changes: Dict[str, List[Dict[str, Any]]] = {"added": [], "modified": [], "removed": []}
+            if channels_complete:
+                channel_changes = self._diff_channels(channels)
+                self._channels_directory = channels
+                self._channels_fetched_at = time.time()
+                self._apply_directory_changes("channel", channel_changes)
+            
+            self._snapshot_dirty = True
         
-        # Bot Token용 헤더 (기본)
-        self.headers: Dict[str, str] = {
-            "Authorization": f"Bearer {self.bot_token}",
-            "Content-Type": "application/json"
-        }
+        def changelog(changes: Dict[str, List[Dict[str, Any]]], baseline: bool) -> Dict[str, Any]:
+            if baseline:
+                return {"baseline": True}
+            
+            summary: Dict[str, Any] = {"truncated": False}
+            for kind, entries in changes.items():
+                summary[f"{kind}_count"] = len(entries)
+                summary[kind] = [
+                    {"id": entry["id"], "name": entry.get("name", "")} 
+                    for entry in entries[:CHANGELOG_MAX_ENTRIES]
+                ]
+                summary["truncated"] = summary["truncated"] or len(entries) > CHANGELOG_MAX_ENTRIES
+            return summary
         
-        # User Token용 헤더 (검색 기능용)
-        self.user_headers: Optional[Dict[str, str]] = None
-        if self.user_token:
-            self.user_headers = {
-                "Authorization": f"Bearer {self.user_token}",
-                "Content-Type": "application/json"
-            }
+        return {
+            "success": True,
+            "mode": "delta",
+            "baseline": users_baseline and (channels_baseline or not channels_complete),
+            "total_users": len(users),
+            "total_channels": len(self._channels_directory or []),
+            "channels_refreshed": channels_complete,
+            "users": changelog(user_changes, users_baseline),
+            "channels": changelog(channel_changes, channels_baseline)
+        }
     
-    def make_request(
+    def _diff_users(
         self, 
-        endpoint: str, 
-        method: str = "GET", 
-        data: Optional[Dict[str, Any]] = None, 
-        use_user_token: bool = False
-    ) -> Dict[str, Any]:
+        members: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
         """
-        Slack API 요청을 위한 헬퍼 메서드
+        새로 조회한 users.list 멤버를 캐시된 사용자 디렉토리와 비교합니다.
+        updated 타임스탬프가 같은 사용자는 기존 항목을 그대로 재사용합니다.
         
         Args:
-            endpoint (str): API 엔드포인트
-            method (str): HTTP 메서드 (GET 또는 POST)
-            data (Optional[Dict[str, Any]]): 요청 데이터
-            use_user_token (bool): User Token 사용 여부 (검색 기능용)
+            members (List[Dict[str, Any]]): users.list의 사용자 객체 목록
         
         Returns:
-            Dict[str, Any]: API 응답 결과
+            Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]: (변경 내역, 새 사용자 디렉토리)
         """
-        url: str = f"{self.base_url}/{endpoint}"
-        
-        # User Token 사용 시
-        if use_user_token:
-            if not self.user_headers:
-                return {
-                    "ok": False,
-                    "error": "SLACK_USER_TOKEN 환경변수가 설정되지 않았습니다."
-                }
-            headers: Dict[str, str] = self.user_headers
-        else:
-            headers = self.headers
+        cached: Dict[str, Dict[str, Any]] = {user["id"]: user for user in self._users_directory or []}
+        changes: Dict[str, List[Dict[str, Any]]] = {"added": [], "modified": [], "removed": []}
+        users: List[Dict[str, Any]] = []
         
-        try:
-            response: requests.Response
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=data)
-            else:
-                response = requests.post(url, headers=headers, json=data)
+        for member in members:
+            # 삭제된 사용자는 디렉토리에서 제거
+            if member.get("deleted", False):
+                continue
             
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return {
-                "ok": False,
-                "error": f"HTTP 요청 오류: {str(e)}"
-            }
+            previous: Optional[Dict[str, Any]] = cached.pop(member["id"], None)
+            if previous is not None and member.get("updated") and previous.get("updated") == member.get("updated"):
+                users.append(previous)
+                continue
+            
+            user_data: Dict[str, Any] = self._format_user(member)
+            users.append(user_data)
+            if previous is None:
+                changes["added"].append(user_data)
+            elif previous != user_data:
+                changes["modified"].append(user_data)
+        
+        changes["removed"] = list(cached.values())
+        return changes, users
     
-    def send_message(self, channel: str, text: str) -> Dict[str, Any]:
+    def _diff_channels(self, channels: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
-        지정된 Slack 채널에 메시지를 전송합니다.
+        새로 조회한 채널 목록을 캐시된 채널 디렉토리와 비교합니다.
         
         Args:
-            channel (str): 채널 ID 또는 채널명 (예: #general, C1234567890)
-            text (str): 전송할 메시지 내용 (UTF-8 인코딩 한글 지원)
+            channels (List[Dict[str, Any]]): get_channels 형식의 채널 목록
         
         Returns:
-            Dict[str, Any]: API 응답 결과
+            Dict[str, List[Dict[str, Any]]]: added, modified, removed 채널 목록
         """
-        data: Dict[str, str] = {
-            "channel": channel,
-            "text": text
-        }
+        cached: Dict[str, Dict[str, Any]] = {channel["id"]: channel for channel in self._channels_directory or []}
+        changes: Dict[str, List[Dict[str, Any]]] = {"added": [], "modified": [], "removed": []}
         
-        result: Dict[str, Any] = self.make_request("chat.postMessage", method="POST", data=data)
+        for channel in channels:
+            previous: Optional[Dict[str, Any]] = cached.pop(channel["id"], None)
+            if previous is None:
+                changes["added"].append(channel)
+            elif previous != channel:
+                changes["modified"].append(channel)
         
-        if result.get("ok"):
-            return {
-                "success": True,
-                "message": "메시지가 성공적으로 전송되었습니다.",
-                "timestamp": result.get("ts"),
-                "channel": result.get("channel")
-            }
-        else:
-            return {
-                "success": False,
-                "error": result.get("error", "알 수 없는 오류가 발생했습니다."),
-                "details": result
-            }
+        changes["removed"] = list(cached.values())
+        return changes
     
-    def get_channels(self) -> Dict[str, Any]:
+    def _apply_directory_changes(self, entity_type: str, changes: Dict[str, List[Dict[str, Any]]]) -> None:
         """
-        접근 가능한 모든 Slack 채널 목록을 조회합니다.
+        변경 내역을 이름 → ID 인덱스와 관련 캐시에 증분 반영합니다 (재구성 없이).
         
-        Returns:
-            Dict[str, Any]: 채널 목록과 정보 (채널 ID, 이름, 공개/비공개 여부, 멤버십 상태)
+        Args:
+            entity_type (str): "user" 또는 "channel"
+            changes (Dict[str, List[Dict[str, Any]]]): added, modified, removed 목록
         """
-        # 공개 채널 조회
-        public_channels: Dict[str, Any] = self.make_request(
-            "conversations.list", 
-            data={"types": "public_channel"}
-        )
+        if self._entity_index is not None:
+            for entry in changes["removed"]:
+                self._entity_index.remove(entry["id"])
+            for entry in changes["added"] + changes["modified"]:
+                self._entity_index.add(entity_type, entry)
         
-        # 비공개 채널 조회  
-        private_channels: Dict[str, Any] = self.make_request(
-            "conversations.list", 
-            data={"types": "private_channel"}
-        )
+        removed_ids: List[str] = [entry["id"] for entry in changes["removed"]]
+        if entity_type == "user":
+            for user_id in removed_ids:
+                self._dm_channels.pop(user_id, None)
+            with self._channel_members_lock:
+                for members in self._channel_members.values():
+                    members.difference_update(removed_ids)
+        else:
+            with self._channel_members_lock:
+                for channel_id in removed_ids:
+                    self._channel_members.pop(channel_id, None)
+                    self._channel_members_fetched_at.pop(channel_id, None)
+    
+    def get_entity_index(self, load: bool = True) -> Optional[EntityIndex]:
+        """
+        캐시된 디렉토리로 만든 이름 → ID 인덱스를 반환합니다.
+        사용자/채널 디렉토리가 모두 로드된 경우에만 인덱스를 만들어 캐시합니다.
         
-        channels: List[Dict[str, Any]] = []
+        Args:
+            load (bool): 디렉토리 캐시가 비어 있으면 Slack에서 조회할지 여부 (기본값: True)
         
-        # 공개 채널 처리
-        if public_channels.get("ok"):
-            for channel in public_channels.get("channels", []):
-                channels.append({
-                    "id": channel["id"],
-                    "name": channel["name"],
-                    "is_private": False,
-                    "is_member": channel.get("is_member", False),
-                    "topic": channel.get("topic", {}).get("value", ""),
-                    "purpose": channel.get("purpose", {}).get("value", "")
-                })
+        Returns:
+            Optional[EntityIndex]: 인덱스 (디렉토리를 불러오지 못했으면 None)
+        """
+        self._load_snapshot()
         
-        # 비공개 채널 처리
-        if private_channels.get("ok"):
-            for channel in private_channels.get("channels", []):
-                channels.append({
-                    "id": channel["id"],
-                    "name": channel["name"],
-                    "is_private": True,
-                    "is_member": channel.get("is_member", False),
-                    "topic": channel.get("topic", {}).get("value", ""),
-                    "purpose": channel.get("purpose", {}).get("value", "")
-                })
+        with self._directory_lock:
+            if self._entity_index is not None:
+                return self._entity_index
+            directory_loaded: bool = self._users_directory is not None and self._channels_directory is not None
         
-        return {
-            "success": True,
-            "total_channels": len(channels),
-            "channels": channels
-        }
+        # 네트워크 조회는 잠금 밖에서 (다른 도구의 캐시 조회를 막지 않도록)
+        if not directory_loaded and (not load or not self._load_directory()):
+            return None
+        
+        with self._directory_lock:
+            if self._entity_index is None:
+                if self._users_directory is None or self._channels_directory is None:
+                    return None
+                index: EntityIndex = EntityIndex()
+                index.build(self._users_directory, self._channels_directory)
+                self._entity_index = index
+            return self._entity_index
     
-    def get_channel_history(self, channel_id: str, limit: int = 10) -> Dict[str, Any]:
+    def _load_directory(self) -> bool:
         """
-        지정된 채널의 최근 메시지 히스토리를 조회합니다.
-        
-        Args:
-            channel_id (str): 조회할 채널의 ID
-            limit (int): 조회할 메시지 수 (기본값: 10, 최대: 100)
+        비어 있는 사용자/채널 디렉토리를 백그라운드 스레드에서 조회하고, 현재 마감 시간까지 기다립니다.
+        조회는 도구 호출 마감 시간과 관계없이 끝까지 진행되므로, 큰 워크스페이스에서는
+        마감 시간 안에 끝나지 않더라도 다음 호출부터 캐시를 사용할 수 있습니다.
         
         Returns:
-            Dict[str, Any]: 메시지 히스토리 (메시지 내용, 작성자, 타임스탬프)
+            bool: 사용자/채널 디렉토리가 모두 로드되었는지 여부
         """
-        # limit 값 검증
-        if limit > 100:
-            limit = 100
-        elif limit < 1:
-            limit = 1
+        with self._directory_lock:
+            loading: Optional[threading.Event] = self._directory_loading
+            start: bool = loading is None
+            if loading is None:
+                loading = threading.Event()
+                self._directory_loading = loading
         
-        data: Dict[str, Union[str, int]] = {
-            "channel": channel_id,
-            "limit": limit
-        }
+        if start:
+            def load() -> None:
+                try:
+                    if self._users_directory is None:
+                        self.get_users()
+                    if self._channels_directory is None:
+                        self.get_channels()
+                finally:
+                    with self._directory_lock:
+                        self._directory_loading = None
+                    loading.set()
+            
+            # 새 스레드는 호출한 도구의 마감 시간(contextvar)을 물려받지 않음
+            threading.Thread(target=load, name="slack-directory-load", daemon=True).start()
         
-        result: Dict[str, Any] = self.make_request("conversations.history", data=data)
+        remaining: Optional[float] = self.request_timeout(default=float("inf"))
+        if remaining is not None:
+            loading.wait(None if remaining == float("inf") else remaining)
         
-        if not result.get("ok"):
-            return {
-                "success": False,
-                "error": result.get("error", "메시지 히스토리를 가져올 수 없습니다."),
-                "details": result
-            }
+        with self._directory_lock:
+            return self._users_directory is not None and self._channels_directory is not None
+    
+    def _snapshot_workspace_key(self) -> str:
+        """
+        스냅샷이 현재 워크스페이스의 것인지 확인하기 위한 키를 반환합니다 (토큰 해시).
         
-        messages: List[Dict[str, Any]] = []
-        for msg in result.get("messages", []):
-            # 사용자 정보 조회
-            user_info: Optional[Dict[str, Any]] = None
-            if msg.get("user"):
-                user_response: Dict[str, Any] = self.make_request("users.info", data={"user": msg["user"]})
-                if user_response.get("ok"):
-                    user_info = user_response.get("user", {})
+        Returns:
+            str: Bot Token의 SHA-256 해시 앞부분
+        """
+        return hashlib.sha256((self.bot_token or "").encode("utf-8")).hexdigest()[:16]
+    
+    def _load_snapshot(self) -> None:
+        """
+        디스크의 디렉토리 캐시 스냅샷을 처음 필요할 때 한 번만 불러옵니다.
+        버전/워크스페이스가 다르거나 TTL이 지난 항목은 무시하고,
+        오래된 스냅샷이면 백그라운드에서 디렉토리를 새로 고칩니다.
+        """
+        with self._directory_lock:
+            if self._snapshot_loaded:
+                return
+            self._snapshot_loaded = True
             
-            message_data: Dict[str, Any] = {
-                "text": msg.get("text", ""),
-                "user_id": msg.get("user", ""),
-                "user_name": user_info.get("real_name", "") if user_info else "",
-                "timestamp": msg.get("ts", ""),
-                "type": msg.get("type", ""),
-                "subtype": msg.get("subtype", "")
-            }
+            if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+                return
             
-            # 스레드 정보가 있는 경우
-            if msg.get("thread_ts"):
-                message_data["is_thread_reply"] = True
-                message_data["thread_timestamp"] = msg.get("thread_ts")
+            try:
+                with gzip.open(self.snapshot_path, "rt", encoding="utf-8") as snapshot_file:
+                    snapshot: Dict[str, Any] = json.load(snapshot_file)
+            except (OSError, ValueError):
+                return
             
-            messages.append(message_data)
+            if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("workspace") != self._snapshot_workspace_key():
+                return
+            
+            now: float = time.time()
+            users_fetched_at: float = snapshot.get("users_fetched_at", 0.0)
+            channels_fetched_at: float = snapshot.get("channels_fetched_at", 0.0)
+            
+            if self._users_directory is None and now - users_fetched_at < self.snapshot_ttl:
+                self._users_directory = snapshot.get("users")
+                self._users_fetched_at = users_fetched_at
+                self._entity_index = None
+            
+            if self._channels_directory is None and now - channels_fetched_at < self.snapshot_ttl:
+                self._channels_directory = snapshot.get("channels")
+                self._channels_fetched_at = channels_fetched_at
+                self._entity_index = None
+            
+            # DM 채널 ID는 바뀌지 않으므로 TTL과 관계없이 사용
+            for user_id, dm_channel_id in snapshot.get("dm_channels", {}).items():
+                self._dm_channels.setdefault(user_id, dm_channel_id)
+            
+            # 업로드 캐시는 재사용 시 files.info로 검증하므로 TTL과 관계없이 사용
+            for digest, upload in snapshot.get("uploads", {}).items():
+                self._upload_cache.setdefault(digest, upload)
+            
+            oldest_fetched_at: float = min(users_fetched_at, channels_fetched_at)
+            if now - oldest_fetched_at > self.snapshot_refresh_after:
+                self.refresh_directory_in_background()
+    
+    def save_snapshot(self) -> Dict[str, Any]:
+        """
+        디렉토리 캐시(사용자, 채널, DM 채널 ID)와 업로드 캐시를 디스크 스냅샷으로 저장합니다.
+        임시 파일에 쓴 뒤 교체하므로 동시에 실행 중인 다른 프로세스가 깨진 파일을 읽지 않습니다.
+        
+        Returns:
+            Dict[str, Any]: 저장 결과
+        """
+        if not self.snapshot_path:
+            return {"success": False, "error": "SLACK_CACHE_SNAPSHOT 경로가 설정되지 않았습니다."}
+        
+        with self._directory_lock:
+            snapshot: Dict[str, Any] = {
+                "version": SNAPSHOT_VERSION,
+                "workspace": self._snapshot_workspace_key(),
+                "saved_at": time.time(),
+                "users_fetched_at": self._users_fetched_at,
+                "channels_fetched_at": self._channels_fetched_at,
+                "users": self._users_directory or [],
+                "channels": self._channels_directory or [],
+                "dm_channels": dict(self._dm_channels),
+                "uploads": dict(self._upload_cache)
+            }
+            self._snapshot_dirty = False
+        
+        snapshot_dir: str = os.path.dirname(os.path.abspath(self.snapshot_path))
+        try:
+            # 사용자 이메일이 담기므로 새로 만드는 디렉토리는 본인만 접근 가능하게
+            os.makedirs(snapshot_dir, mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=snapshot_dir, suffix=".tmp", delete=False) as temp_file:
+                temp_path: str = temp_file.name
+                with gzip.GzipFile(fileobj=temp_file, mode="wb", compresslevel=5) as gzip_file:
+                    gzip_file.write(json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            os.replace(temp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning("디렉토리 캐시 스냅샷을 저장하지 못했습니다 (%s): %s", self.snapshot_path, e)
+            with self._directory_lock:
+                self._snapshot_dirty = True
+            return {"success": False, "error": f"스냅샷 저장 중 오류가 발생했습니다: {str(e)}"}
         
         return {
             "success": True,
-            "channel_id": channel_id,
-            "message_count": len(messages),
-            "messages": messages
+            "path": self.snapshot_path,
+            "users": len(snapshot["users"]),
+            "channels": len(snapshot["channels"]),
+            "dm_channels": len(snapshot["dm_channels"])
         }
     
-    def send_direct_message(self, user_id: str, text: str) -> Dict[str, Any]:
+    def _save_snapshot_if_dirty(self) -> None:
         """
-        특정 사용자에게 1:1 다이렉트 메시지를 전송합니다.
-        
-        Args:
-            user_id (str): 메시지를 받을 사용자의 ID
-            text (str): 전송할 메시지 내용
+        캐시가 바뀐 경우에만 스냅샷을 저장합니다 (프로세스 종료 시 호출).
+        """
+        if self._snapshot_dirty and self.snapshot_path:
+            self.save_snapshot()
+    
+    def refresh_directory_in_background(self) -> bool:
+        """
+        사용자/채널 디렉토리를 백그라운드 스레드에서 증분 갱신하고 스냅샷을 저장합니다.
+        그동안 기존 캐시는 계속 사용됩니다.
         
         Returns:
-            Dict[str, Any]: API 응답 결과
+            bool: 새 새로 고침을 시작했는지 여부 (이미 진행 중이면 False)
         """
-        # DM 채널 열기
-        dm_open_data: Dict[str, str] = {"users": user_id}
-        dm_channel_result: Dict[str, Any] = self.make_request("conversations.open", method="POST", data=dm_open_data)
-        
-        if not dm_channel_result.get("ok"):
-            return {
-                "success": False,
-                "error": f"DM 채널을 열 수 없습니다: {dm_channel_result.get('error', '알 수 없는 오류')}",
-                "details": dm_channel_result
-            }
+        with self._directory_lock:
+            if self._snapshot_refreshing:
+                return False
+            self._snapshot_refreshing = True
         
-        # DM 채널 ID 가져오기
-        dm_channel_id: str = dm_channel_result.get("channel", {}).get("id", "")
-        
-        if not dm_channel_id:
-            return {
-                "success": False,
-                "error": "DM 채널 ID를 가져올 수 없습니다.",
-                "details": dm_channel_result
-            }
+        def refresh() -> None:
+            try:
+                refresh_result: Dict[str, Any] = self.refresh_directory(mode="delta")
+                if refresh_result.get("success") and self.snapshot_path:
+                    self.save_snapshot()
+            finally:
+                with self._directory_lock:
+                    self._snapshot_refreshing = False
         
-        # 메시지 전송
-        return self.send_message(dm_channel_id, text)
+        threading.Thread(target=refresh, name="slack-directory-refresh", daemon=True).start()
+        return True
     
-    def invite_user_to_channel(self, channel_id: str, user_id: str) -> Dict[str, Any]:
+    def resolve_entities(
+        self, 
+        queries: List[str], 
+        entity_type: Optional[str] = None, 
+        limit: int = 5
+    ) -> Dict[str, Any]:
         """
-        지정된 채널에 사용자를 초대합니다.
+        이름, 실명, 표시 이름, 이메일로 사용자/채널 ID를 찾습니다.
         
         Args:
-            channel_id (str): 초대할 채널의 ID
-            user_id (str): 초대할 사용자의 ID
+            queries (List[str]): 검색어 목록 (예: ["#general", "@pepe", "pepe@example.com"])
+            entity_type (Optional[str]): "user" 또는 "channel"로 제한 (기본값: 전체)
+            limit (int): 검색어별 최대 결과 수 (기본값: 5)
         
         Returns:
-            Dict[str, Any]: API 응답 결과
+            Dict[str, Any]: 검색어별 후보 목록 (ID, 이름, match_type, score)
         """
-        data: Dict[str, str] = {
-            "channel": channel_id,
-            "users": user_id
-        }
-        
-        result: Dict[str, Any] = self.make_request("conversations.invite", method="POST", data=data)
-        
-        if result.get("ok"):
-            return {
-                "success": True,
-                "message": "사용자가 성공적으로 채널에 초대되었습니다.",
-                "channel": channel_id,
-                "user": user_id
-            }
-        else:
+        index: Optional[EntityIndex] = self.get_entity_index()
+        if index is None or not len(index):
             return {
                 "success": False,
-                "error": result.get("error", "사용자 초대에 실패했습니다."),
-                "details": result
+                "error": "사용자/채널 디렉토리를 불러올 수 없습니다. (조회 중이면 잠시 후 다시 시도하세요)"
             }
+        
+        results: List[Dict[str, Any]] = []
+        for query in queries:
+            matches: List[Dict[str, Any]] = index.search(query, entity_type, limit)
+            results.append({
+                "query": query,
+                "match_count": len(matches),
+                "matches": matches
+            })
+        
+        return {
+            "success": True,
+            "results": results
+        }
     
-    def get_users(self) -> Dict[str, Any]:
+    def resolve_entity_id(self, value: str, entity_type: str, load: bool = True) -> Dict[str, Any]:
         """
-        워크스페이스의 모든 사용자 목록을 조회합니다.
+        사용자/채널 ID 또는 이름을 ID로 변환합니다.
+        ID 형식이면 그대로 사용하고, 이름이면 정확/대소문자 무시 일치가 하나일 때만 변환합니다.
+        
+        Args:
+            value (str): ID 또는 이름 (예: "U0123456789", "@pepe", "#general")
+            entity_type (str): "user" 또는 "channel"
+            load (bool): 디렉토리 캐시가 비어 있으면 Slack에서 조회할지 여부 (기본값: True)
         
         Returns:
-            Dict[str, Any]: 사용자 목록과 정보 (사용자 ID, 이름, 이메일, 프로필 등)
+            Dict[str, Any]: 변환된 ID 또는 후보 목록이 포함된 오류
         """
-        result: Dict[str, Any] = self.make_request("users.list")
+        value = value.strip()
+        pattern: "re.Pattern[str]" = USER_ID_PATTERN if entity_type == "user" else CHANNEL_ID_PATTERN
+        if pattern.match(value):
+            return {"success": True, "id": value}
         
-        if not result.get("ok"):
+        index: Optional[EntityIndex] = self.get_entity_index(load=load)
+        if index is None:
             return {
                 "success": False,
-                "error": result.get("error", "사용자 목록을 가져올 수 없습니다."),
-                "details": result
+                "error": f"'{value}'을(를) ID로 변환할 수 없습니다 (디렉토리가 로드되지 않음)."
             }
         
-        users: List[Dict[str, Any]] = []
-        for user in result.get("members", []):
-            # 삭제된 사용자나 봇은 제외 (선택적)
-            if user.get("deleted", False):
-                continue
-            
-            user_data: Dict[str, Any] = {
-                "id": user["id"],
-                "name": user.get("name", ""),
-                "real_name": user.get("real_name", ""),
-                "display_name": user.get("profile", {}).get("display_name", ""),
-                "email": user.get("profile", {}).get("email", ""),
-                "is_bot": user.get("is_bot", False),
-                "is_admin": user.get("is_admin", False),
-                "is_owner": user.get("is_owner", False),
-                "status": user.get("profile", {}).get("status_text", ""),
-                "timezone": user.get("tz", ""),
-                "image_url": user.get("profile", {}).get("image_72", "")
-            }
-            
-            users.append(user_data)
+        matches: List[Dict[str, Any]] = index.search(value, entity_type, limit=5)
+        exact_matches: List[Dict[str, Any]] = [
+            match for match in matches if match["match_type"] in ("exact", "casefold")
+        ]
+        exact_ids: Set[str] = {match["id"] for match in exact_matches}
+        
+        if len(exact_ids) == 1:
+            return {"success": True, "id": exact_matches[0]["id"]}
         
         return {
-            "success": True,
-            "total_users": len(users),
-            "users": users
+            "success": False,
+            "error": f"'{value}'에 해당하는 {'사용자' if entity_type == 'user' else '채널'}를 하나로 특정할 수 없습니다.",
+            "candidates": exact_matches or matches
         }
     
     def add_reaction(self, channel_id: str, timestamp: str, emoji: str = "jammies-frog") -> Dict[str, Any]:
         """
         특정 메시지에 이모지 반응을 추가합니다.
+        이미 같은 반응이 달려 있는 경우(already_reacted)도 성공으로 처리합니다.
         
         Args:
             channel_id (str): 메시지가 있는 채널의 ID
@@ -371,23 +2704,81 @@ class SlackAPIClient:
             "name": emoji
         }
         
-        result: Dict[str, Any] = self.make_request("reactions.add", method="POST", data=data)
+        result: Dict[str, Any] = self.rate_limited_request("reactions.add", method="POST", data=data)
         
-        if result.get("ok"):
+        if result.get("ok") or result.get("error") == "already_reacted":
             return {
                 "success": True,
                 "message": f"🐸 {emoji} 이모지 반응이 성공적으로 추가되었습니다!",
                 "channel": channel_id,
                 "timestamp": timestamp,
-                "emoji": emoji
+                "emoji": emoji,
+                "already_reacted": not result.get("ok")
             }
         else:
             return {
                 "success": False,
                 "error": result.get("error", "이모지 반응 추가에 실패했습니다."),
+                "channel": channel_id,
+                "timestamp": timestamp,
+                "emoji": emoji,
                 "details": result
             }
     
+    def add_reactions_bulk(
+        self, 
+        reactions: List[Dict[str, str]], 
+        default_emoji: str = "jammies-frog"
+    ) -> Dict[str, Any]:
+        """
+        여러 메시지에 이모지 반응을 동시에 추가합니다.
+        reactions.add의 속도 제한 티어(Tier 3)를 지키며 워커 풀에서 병렬로 처리합니다.
+        
+        Args:
+            reactions (List[Dict[str, str]]): 반응을 추가할 항목 목록
+                (각 항목: {"channel_id": ..., "timestamp": ..., "emoji": ...(선택)})
+            default_emoji (str): 항목에 emoji가 없을 때 사용할 이모지 (기본값: "jammies-frog")
+        
+        Returns:
+            Dict[str, Any]: 항목별 결과 (입력 순서 유지)와 성공/실패 집계
+        """
+        futures: List[Optional[Future]] = []
+        results: List[Dict[str, Any]] = []
+        
+        for item in reactions:
+            channel_id: str = item.get("channel_id", "")
+            timestamp: str = item.get("timestamp", "")
+            
+            if not channel_id or not timestamp:
+                futures.append(None)
+                continue
+            
+            futures.append(self._submit(
+                self.add_reaction, channel_id, timestamp, item.get("emoji") or default_emoji
+            ))
+        
+        for item, future in zip(reactions, futures):
+            if future is None:
+                results.append({
+                    "success": False,
+                    "error": "channel_id와 timestamp가 모두 필요합니다.",
+                    "channel": item.get("channel_id", ""),
+                    "timestamp": item.get("timestamp", "")
+                })
+            else:
+                results.append(future.result())
+        
+        succeeded: int = sum(1 for result in results if result.get("success"))
+        
+        return {
+            "success": succeeded == len(results),
+            "message": f"🐸 {len(results)}개 중 {succeeded}개의 이모지 반응을 처리했습니다.",
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }
+    
     def search_messages(self, query: str, sort: str = "timestamp", count: int = 20) -> Dict[str, Any]:
         """
         키워드를 통해 워크스페이스의 메시지를 검색합니다.
@@ -422,37 +2813,14 @@ class SlackAPIClient:
                 "details": result
             }
         
-        messages: List[Dict[str, Any]] = []
         search_results: Dict[str, Any] = result.get("messages", {})
+        matches: List[Dict[str, Any]] = search_results.get("matches", [])
         
-        for match in search_results.get("matches", []):
-            # 채널 정보 가져오기 (Bot Token 사용)
-            channel_info: Optional[Dict[str, Any]] = None
-            if match.get("channel", {}).get("id"):
-                channel_response: Dict[str, Any] = self.make_request("conversations.info", 
-                                                   data={"channel": match["channel"]["id"]})
-                if channel_response.get("ok"):
-                    channel_info = channel_response.get("channel", {})
-            
-            # 사용자 정보 가져오기 (Bot Token 사용)
-            user_info: Optional[Dict[str, Any]] = None
-            if match.get("user"):
-                user_response: Dict[str, Any] = self.make_request("users.info", data={"user": match["user"]})
-                if user_response.get("ok"):
-                    user_info = user_response.get("user", {})
-            
-            message_data: Dict[str, Any] = {
-                "text": match.get("text", ""),
-                "user_id": match.get("user", ""),
-                "user_name": user_info.get("real_name", "") if user_info else "",
-                "channel_id": match.get("channel", {}).get("id", ""),
-                "channel_name": channel_info.get("name", "") if channel_info else "",
-                "timestamp": match.get("ts", ""),
-                "permalink": match.get("permalink", ""),
-                "score": match.get("score", 0)
-            }
-            
-            messages.append(message_data)
+        # 사용자/채널 정보는 중복 없이 한 번에 조회 (Bot Token 사용)
+        user_names, channel_names = self._enrich_matches(matches)
+        messages: List[Dict[str, Any]] = [
+            self._format_search_match(match, user_names, channel_names) for match in matches
+        ]
         
         return {
             "success": True,
@@ -462,6 +2830,544 @@ class SlackAPIClient:
             "messages": messages
         }
     
+    def search_messages_multi(
+        self, 
+        queries: List[str], 
+        sort: str = "timestamp", 
+        pages_per_query: int = 1, 
+        count: int = 100
+    ) -> Dict[str, Any]:
+        """
+        여러 검색어와 여러 페이지를 search.messages 속도 제한(Tier 2) 안에서 병렬로 검색합니다.
+        같은 메시지(채널, ts)는 하나로 합치고, 점수 또는 시간순으로 정렬한 뒤
+        사용자/채널 이름을 한 번의 일괄 조회로 채웁니다.
+        ⚠️ 이 기능은 User Token (SLACK_USER_TOKEN)과 search:read 권한이 필요합니다.
+        
+        Args:
+            queries (List[str]): 검색어 목록 (예: ["deploy 실패", "in:#ops rollback"])
+            sort (str): 정렬 방식 ("timestamp", "score") 기본값: "timestamp"
+            pages_per_query (int): 검색어당 조회할 페이지 수 (기본값: 1, 최대: 20)
+            count (int): 페이지당 메시지 수 (기본값: 100, 최대: 100)
+        
+        Returns:
+            Dict[str, Any]: 검색어별 통계와 중복 제거·정렬된 검색 결과
+        """
+        unique_queries: List[str] = list(dict.fromkeys(q.strip() for q in queries if q.strip()))
+        pages_per_query = max(1, min(pages_per_query, SEARCH_MAX_PAGES_PER_QUERY))
+        count = max(1, min(count, 100))
+        
+        if not unique_queries:
+            return {
+                "success": False,
+                "error": "검색어가 비어 있습니다."
+            }
+        
+        def search_page(query: str, page: int) -> Dict[str, Any]:
+            return self.rate_limited_request(
+                "search.messages", 
+                data={"query": query, "sort": sort, "count": count, "page": page}, 
+                use_user_token=True
+            )
+        
+        # 1단계: 검색어별 첫 페이지로 전체 페이지 수 확인
+        first_pages: Dict[str, Dict[str, Any]] = {
+            query: future.result() 
+            for query, future in [(query, self._submit(search_page, query, 1)) for query in unique_queries]
+        }
+        
+        # 2단계: 나머지 페이지를 모든 검색어에 대해 동시에 조회
+        page_futures: List[Tuple[str, Future]] = []
+        for query, first_page in first_pages.items():
+            total_pages: int = first_page.get("messages", {}).get("paging", {}).get("pages", 1)
+            for page in range(2, min(total_pages, pages_per_query) + 1):
+                page_futures.append((query, self._submit(search_page, query, page)))
+        
+        pages_by_query: Dict[str, List[Dict[str, Any]]] = {query: [page] for query, page in first_pages.items()}
+        for query, future in page_futures:
+            pages_by_query[query].append(future.result())
+        
+        # (채널, ts) 기준 중복 제거 - 가장 높은 점수와 일치한 검색어 목록 유지
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        matched_queries: Dict[Tuple[str, str], List[str]] = {}
+        query_stats: List[Dict[str, Any]] = []
+        
+        for query in unique_queries:
+            errors: List[str] = []
+            match_count: int = 0
+            for page_result in pages_by_query[query]:
+                if not page_result.get("ok"):
+                    errors.append(page_result.get("error", "메시지 검색에 실패했습니다."))
+                    continue
+                for match in page_result.get("messages", {}).get("matches", []):
+                    key: Tuple[str, str] = (match.get("channel", {}).get("id", ""), match.get("ts", ""))
+                    match_count += 1
+                    if key not in merged or match.get("score", 0) > merged[key].get("score", 0):
+                        merged[key] = match
+                    matched_queries.setdefault(key, [])
+                    if query not in matched_queries[key]:
+                        matched_queries[key].append(query)
+            
+            query_stats.append({
+                "query": query,
+                "total_results": pages_by_query[query][0].get("messages", {}).get("total", 0),
+                "pages_fetched": len(pages_by_query[query]) - len(errors),
+                "match_count": match_count,
+                "errors": errors
+            })
+        
+        ordered_keys: List[Tuple[str, str]] = sorted(
+            merged, 
+            key=lambda k: merged[k].get("score", 0) if sort == "score" else float(k[1] or 0), 
+            reverse=True
+        )
+        
+        user_names, channel_names = self._enrich_matches([merged[key] for key in ordered_keys])
+        messages: List[Dict[str, Any]] = []
+        for key in ordered_keys:
+            message_data: Dict[str, Any] = self._format_search_match(merged[key], user_names, channel_names)
+            message_data["queries"] = matched_queries[key]
+            messages.append(message_data)
+        
+        failed_queries: int = sum(1 for stats in query_stats if stats["pages_fetched"] == 0)
+        
+        return {
+            "success": failed_queries < len(unique_queries),
+            "queries": query_stats,
+            "sort": sort,
+            "message_count": len(messages),
+            "messages": messages
+        }
+    
+    def _enrich_matches(self, matches: List[Dict[str, Any]]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        검색 결과에 등장하는 사용자/채널 이름을 한 번에 조회합니다.
+        캐시된 디렉토리를 먼저 사용하고, 없는 ID만 중복 없이 병렬로 조회합니다.
+        
+        Args:
+            matches (List[Dict[str, Any]]): search.messages의 match 목록
+        
+        Returns:
+            Tuple[Dict[str, str], Dict[str, str]]: (사용자 ID → 실명, 채널 ID → 채널명)
+        """
+        user_ids: Set[str] = {match["user"] for match in matches if match.get("user")}
+        channel_ids: Set[str] = {
+            match["channel"]["id"] for match in matches if match.get("channel", {}).get("id")
+        }
+        
+        user_names: Dict[str, str] = {}
+        channel_names: Dict[str, str] = {}
+        
+        index: Optional[EntityIndex] = self.get_entity_index(load=False)
+        if index is not None:
+            for user_id in user_ids:
+                entity: Optional[Dict[str, Any]] = index.get(user_id)
+                if entity:
+                    user_names[user_id] = entity.get("real_name", "")
+            for channel_id in channel_ids:
+                entity = index.get(channel_id)
+                if entity:
+                    channel_names[channel_id] = entity.get("name", "")
+        
+        user_futures: Dict[str, Future] = {
+            user_id: self._submit(self.rate_limited_request, "users.info", data={"user": user_id})
+            for user_id in user_ids - set(user_names)
+        }
+        channel_futures: Dict[str, Future] = {
+            channel_id: self._submit(self.rate_limited_request, "conversations.info", data={"channel": channel_id})
+            for channel_id in channel_ids - set(channel_names)
+        }
+        
+        for user_id, future in user_futures.items():
+            user_response: Dict[str, Any] = future.result()
+            if user_response.get("ok"):
+                user_names[user_id] = user_response.get("user", {}).get("real_name", "")
+        for channel_id, future in channel_futures.items():
+            channel_response: Dict[str, Any] = future.result()
+            if channel_response.get("ok"):
+                channel_names[channel_id] = channel_response.get("channel", {}).get("name", "")
+        
+        return user_names, channel_names
+    
+    @staticmethod
+    def _format_search_match(
+        match: Dict[str, Any], 
+        user_names: Dict[str, str], 
+        channel_names: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        search.messages의 match를 응답 형식으로 변환합니다.
+        
+        Args:
+            match (Dict[str, Any]): 검색 결과 항목
+            user_names (Dict[str, str]): 사용자 ID → 실명
+            channel_names (Dict[str, str]): 채널 ID → 채널명
+        
+        Returns:
+            Dict[str, Any]: 메시지 내용, 작성자, 채널, 타임스탬프, permalink, 점수
+        """
+        channel_id: str = match.get("channel", {}).get("id", "")
+        return {
+            "text": match.get("text", ""),
+            "user_id": match.get("user", ""),
+            "user_name": user_names.get(match.get("user", ""), ""),
+            "channel_id": channel_id,
+            "channel_name": channel_names.get(channel_id, ""),
+            "timestamp": match.get("ts", ""),
+            "permalink": match.get("permalink", ""),
+            "score": match.get("score", 0)
+        }
+    
+    def download_file(self, file_id: str, dest_path: str = "", preview_bytes: int = 0) -> Dict[str, Any]:
+        """
+        Slack 파일을 디스크로 내려받습니다 (files.info + url_private 인증 GET).
+        
+        파일은 일정 크기씩 스트리밍으로 저장하여 메모리 사용량이 파일 크기와 무관하며,
+        중간에 끊기면 HTTP Range로 이어받습니다. 받은 파일은 file_id별 로컬 캐시에
+        보관되어 같은 파일을 다시 읽을 때는 Slack에 요청하지 않습니다.
+        
+        Args:
+            file_id (str): 내려받을 Slack 파일 ID (예: F0123456789)
+            dest_path (str): 복사할 경로 (선택사항, 비우면 캐시 경로만 반환)
+            preview_bytes (int): 결과에 포함할 파일 앞부분 텍스트 바이트 수 (기본값: 0)
+        
+        Returns:
+            Dict[str, Any]: 로컬 경로, 크기, SHA-256 해시, 캐시 적중 여부, 미리보기
+        """
+        if not re.match(r"^F[A-Z0-9]{6,}$", file_id):
+            return {
+                "success": False,
+                "error": f"올바른 파일 ID가 아닙니다: {file_id}"
+            }
+        
+        with self._directory_lock:
+            download_lock: threading.Lock = self._download_locks.setdefault(file_id, threading.Lock())
+        
+        with download_lock:
+            try:
+                result: Dict[str, Any] = self._cached_blob(file_id)
+                if not result.get("success"):
+                    result = self._download_blob(file_id, dest_path)
+            except OSError as e:
+                return {
+                    "success": False,
+                    "error": f"파일 캐시에 저장하는 중 오류가 발생했습니다: {str(e)}"
+                }
+            if not result.get("success"):
+                return result
+        
+        try:
+            if dest_path and os.path.abspath(dest_path) != os.path.abspath(result["path"]):
+                shutil.copyfile(result["path"], dest_path)
+                result["path"] = dest_path
+            
+            if preview_bytes > 0:
+                with open(result["path"], "rb") as blob_file:
+                    result["preview"] = blob_file.read(preview_bytes).decode("utf-8", errors="replace")
+        except OSError as e:
+            return {
+                "success": False,
+                "error": f"파일 복사/읽기 중 오류가 발생했습니다: {str(e)}"
+            }
+        
+        return result
+    
+    def _blob_paths(self, file_id: str) -> Tuple[str, str, str]:
+        """
+        캐시된 파일, 내려받는 중인 파일, 메타데이터 파일의 경로를 반환합니다.
+        
+        Args:
+            file_id (str): Slack 파일 ID
+        
+        Returns:
+            Tuple[str, str, str]: (캐시 파일, .part 파일, .json 메타데이터) 경로
+        """
+        base_path: str = os.path.join(self.blob_cache_dir, file_id)
+        return base_path, f"{base_path}.part", f"{base_path}.json"
+    
+    def _cached_blob(self, file_id: str) -> Dict[str, Any]:
+        """
+        로컬 캐시에 온전한 파일이 있으면 사용 시각을 갱신하고 반환합니다.
+        
+        Args:
+            file_id (str): Slack 파일 ID
+        
+        Returns:
+            Dict[str, Any]: 캐시 적중 결과 (없거나 크기가 맞지 않으면 success=False)
+        """
+        blob_path, _, meta_path = self._blob_paths(file_id)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as meta_file:
+                meta: Dict[str, Any] = json.load(meta_file)
+            if os.path.getsize(blob_path) != meta.get("size"):
+                return {"success": False}
+            os.utime(blob_path)
+        except (OSError, ValueError):
+            return {"success": False}
+        
+        return dict(meta, success=True, file_id=file_id, path=blob_path, cached=True, resumed_from=0)
+    
+    def _download_blob(self, file_id: str, dest_path: str) -> Dict[str, Any]:
+        """
+        파일을 .part 파일로 스트리밍 다운로드하고, 크기를 검증한 뒤 캐시에 등록합니다.
+        
+        Args:
+            file_id (str): Slack 파일 ID
+            dest_path (str): 캐시 용량보다 큰 파일을 직접 저장할 경로
+        
+        Returns:
+            Dict[str, Any]: 다운로드 결과
+        """
+        info_result: Dict[str, Any] = self.make_request("files.info", data={"file": file_id})
+        if not info_result.get("ok"):
+            return {
+                "success": False,
+                "error": info_result.get("error", "파일 정보를 가져올 수 없습니다."),
+                "details": info_result
+            }
+        
+        file_info: Dict[str, Any] = info_result.get("file", {})
+        if file_info.get("is_external"):
+            return {
+                "success": False,
+                "error": "외부 파일(Google Drive 등)은 Slack에서 내려받을 수 없습니다.",
+                "external_url": file_info.get("url_private", "")
+            }
+        
+        url: str = file_info.get("url_private_download") or file_info.get("url_private", "")
+        expected_size: int = file_info.get("size", 0)
+        mimetype: str = file_info.get("mimetype", "")
+        
+        if not url:
+            return {
+                "success": False,
+                "error": "다운로드 URL이 없는 파일입니다 (외부 파일이거나 삭제된 파일)."
+            }
+        
+        blob_path, part_path, meta_path = self._blob_paths(file_id)
+        too_large: bool = expected_size > self.blob_cache_max_bytes
+        if too_large:
+            if not dest_path:
+                return {
+                    "success": False,
+                    "error": f"파일({expected_size} bytes)이 캐시 용량보다 커서 dest_path를 지정해야 합니다."
+                }
+            blob_path, part_path = dest_path, f"{dest_path}.part"
+        
+        os.makedirs(os.path.dirname(os.path.abspath(part_path)), exist_ok=True)
+        
+        resumed_from: int = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        error: str = ""
+        for _ in range(DOWNLOAD_MAX_ATTEMPTS):
+            error = self._stream_to_part(url, part_path, mimetype)
+            if not error:
+                break
+        
+        if error:
+            return {
+                "success": False,
+                "error": error,
+                "partial_bytes": os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            }
+        
+        # 무결성 검증: files.info의 크기와 받은 크기 비교
+        downloaded_size: int = os.path.getsize(part_path)
+        if expected_size and downloaded_size != expected_size:
+            os.unlink(part_path)
+            return {
+                "success": False,
+                "error": f"파일 크기가 일치하지 않습니다 (예상 {expected_size}, 수신 {downloaded_size} bytes)."
+            }
+        
+        meta: Dict[str, Any] = {
+            "name": file_info.get("name", ""),
+            "mimetype": mimetype,
+            "size": downloaded_size,
+            "sha256": self._file_digest(part_path)
+        }
+        os.replace(part_path, blob_path)
+        
+        if not too_large:
+            with open(meta_path, "w", encoding="utf-8") as meta_file:
+                json.dump(meta, meta_file, ensure_ascii=False)
+            self._evict_blobs(keep=file_id)
+        
+        return dict(meta, success=True, file_id=file_id, path=blob_path, cached=False, resumed_from=resumed_from)
+    
+    def _stream_to_part(self, url: str, part_path: str, mimetype: str) -> str:
+        """
+        url_private에서 .part 파일 뒤에 이어서 내려받습니다.
+        
+        Args:
+            url (str): 파일의 url_private(_download)
+            part_path (str): 내려받는 중인 파일 경로
+            mimetype (str): files.info의 MIME 타입 (로그인 페이지 응답 감지용)
+        
+        Returns:
+            str: 오류 메시지 (성공하면 빈 문자열)
+        """
+        offset: int = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers: Dict[str, str] = {}
+        
+        # Bot Token은 Slack 파일 서버에만 보냄
+        parsed_url: ParseResult = urlparse(url)
+        if parsed_url.scheme == "https" and parsed_url.hostname == "files.slack.com":
+            headers["Authorization"] = f"Bearer {self.bot_token}"
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        
+        timeout: Optional[float] = self.request_timeout()
+        if timeout is None:
+            return "도구 호출 마감 시간이 지나 다운로드를 중단했습니다."
+        
+        try:
+            with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                # 이미 다 받은 파일에 Range를 요청한 경우
+                if response.status_code == 416 and offset:
+                    return ""
+                response.raise_for_status()
+                
+                # 권한이 없으면 Slack은 로그인 HTML 페이지를 200으로 돌려줌
+                content_type: str = response.headers.get("Content-Type", "")
+                if content_type.startswith("text/html") and "html" not in mimetype:
+                    return "파일 대신 HTML 페이지를 받았습니다 (files:read 권한을 확인하세요)."
+                
+                # 서버가 Range를 무시하면 처음부터 다시 받음
+                mode: str = "ab" if response.status_code == 206 else "wb"
+                with open(part_path, mode) as part_file:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        part_file.write(chunk)
+        except requests.RequestException as e:
+            return f"파일 다운로드 중 오류가 발생했습니다: {str(e)}"
+        
+        return ""
+    
+    def _evict_blobs(self, keep: str = "") -> None:
+        """
+        캐시 용량을 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+        
+        Args:
+            keep (str): 삭제하지 않을 file_id (방금 받은 파일)
+        """
+        entries: List[Tuple[float, int, str]] = []
+        total_size: int = 0
+        
+        try:
+            for entry in os.scandir(self.blob_cache_dir):
+                if not entry.is_file() or "." in entry.name:
+                    continue
+                stat: os.stat_result = entry.stat()
+                total_size += stat.st_size
+                if entry.name != keep:
+                    entries.append((stat.st_mtime, stat.st_size, entry.name))
+            
+            for _, size, file_id in sorted(entries):
+                if total_size <= self.blob_cache_max_bytes:
+                    break
+                for path in self._blob_paths(file_id):
+                    if os.path.exists(path):
+                        os.unlink(path)
+                total_size -= size
+        except OSError as e:
+            # 정리에 실패해도 방금 받은 파일은 사용할 수 있음
+            logger.warning("다운로드 캐시를 정리하지 못했습니다 (%s): %s", self.blob_cache_dir, e)
+    
+    @staticmethod
+    def _file_digest(file_path: str) -> str:
+        """
+        파일 내용을 일정 크기씩 읽으며 SHA-256 해시를 계산합니다.
+        
+        Args:
+            file_path (str): 파일 경로
+        
+        Returns:
+            str: 16진수 SHA-256 해시
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file_content:
+            for chunk in iter(lambda: file_content.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _share_cached_upload(
+        self, 
+        digest: str, 
+        channels: str, 
+        title: str, 
+        initial_comment: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        같은 내용으로 업로드된 파일이 아직 Slack에 있으면 permalink를 채널에 공유합니다.
+        공개 파일이거나 모든 대상 채널에 이미 공유된 파일이고 제목이 같을 때만 재사용하며
+        (다른 채널 멤버가 열 수 없는 링크를 보내지 않도록), Slack에서 삭제된 파일이면 캐시에서 제거합니다.
+        
+        Args:
+            digest (str): 파일 내용 해시
+            channels (str): 공유할 채널 ID (쉼표로 구분)
+            title (str): 요청한 파일 제목 (비어 있으면 제목 비교 생략)
+            initial_comment (str): 함께 보낼 코멘트
+        
+        Returns:
+            Optional[Dict[str, Any]]: 공유 결과 (재사용할 수 없으면 None)
+        """
+        with self._directory_lock:
+            cached: Optional[Dict[str, Any]] = self._upload_cache.get(digest)
+        if cached is None:
+            return None
+        
+        info_result: Dict[str, Any] = self.make_request("files.info", data={"file": cached["file_id"]})
+        file_deleted: bool = info_result.get("error") in ("file_not_found", "file_deleted") or (
+            info_result.get("ok") and info_result.get("file", {}).get("mode") == "tombstone"
+        )
+        
+        if file_deleted:
+            with self._directory_lock:
+                self._upload_cache.pop(digest, None)
+                self._snapshot_dirty = True
+            return None
+        
+        if not info_result.get("ok"):
+            # 확인할 수 없으면 안전하게 새로 업로드
+            return None
+        
+        file_info: Dict[str, Any] = info_result.get("file", {})
+        target_channels: List[str] = [channel.strip() for channel in channels.split(",") if channel.strip()]
+        shared_channels: Set[str] = set(
+            file_info.get("channels", []) + file_info.get("groups", []) + file_info.get("ims", [])
+        )
+        for share_type in ("public", "private"):
+            shared_channels.update(file_info.get("shares", {}).get(share_type, {}).keys())
+        
+        visible_everywhere: bool = bool(file_info.get("is_public")) or all(
+            channel in shared_channels for channel in target_channels
+        )
+        if not visible_everywhere or (title and title != file_info.get("title", "")):
+            return None
+        
+        text: str = f"{initial_comment}\n{cached['permalink']}" if initial_comment else cached["permalink"]
+        message_results: List[Dict[str, Any]] = [
+            self.send_message(channel, text, coalesce=False) for channel in target_channels
+        ]
+        
+        if not all(result.get("success") for result in message_results):
+            return {
+                "success": False,
+                "error": "기존 파일을 채널에 공유하지 못했습니다.",
+                "file_id": cached["file_id"],
+                "details": message_results
+            }
+        
+        return {
+            "success": True,
+            "message": "같은 내용의 파일이 이미 있어 기존 파일을 공유했습니다. (중복 업로드 생략)",
+            "deduplicated": True,
+            "file_id": cached["file_id"],
+            "permalink": cached["permalink"],
+            "channels": channels,
+            "filename": cached.get("filename", ""),
+            "file_size": cached.get("file_size", 0),
+            "message_timestamps": [result.get("timestamp") for result in message_results]
+        }
+    
     def upload_file(
         self, 
         channels: str, 
@@ -497,6 +3403,13 @@ class SlackAPIClient:
                 guessed_type, _ = mimetypes.guess_type(file_path)
                 filetype = guessed_type or "application/octet-stream"
             
+            upload_timeout: Optional[float] = self.request_timeout()
+            if upload_timeout is None:
+                return {
+                    "success": False,
+                    "error": "도구 호출 마감 시간이 지나 파일을 업로드하지 않았습니다."
+                }
+            
             # 파일 업로드 요청
             url: str = f"{self.base_url}/files.upload"
             
@@ -520,7 +3433,8 @@ class SlackAPIClient:
                     url, 
                     headers=headers_without_content_type, 
                     data=data, 
-                    files=files
+                    files=files,
+                    timeout=upload_timeout
                 )
                 result: Dict[str, Any] = response.json()
             
@@ -551,18 +3465,24 @@ class SlackAPIClient:
         file_path: str, 
         title: str = "", 
         initial_comment: str = "", 
-        filetype: Optional[str] = None
+        filetype: Optional[str] = None,
+        dedupe: bool = True
     ) -> Dict[str, Any]:
         """
         새로운 Slack API를 사용하여 채널에 파일을 업로드합니다.
         (files.getUploadURLExternal + files.completeUploadExternal)
         
+        같은 내용의 파일이 이미 업로드되어 있고 대상 채널 멤버가 모두 볼 수 있으면(공개 파일이거나
+        모든 채널에 이미 공유됨) 다시 올리지 않고 기존 파일의 permalink를 메시지로 공유합니다.
+        title이 기존 파일과 다르면 새로 업로드합니다.
+        
         Args:
             channels (str): 파일을 업로드할 채널 ID (쉼표로 구분하여 여러 채널 가능)
             file_path (str): 업로드할 파일의 경로
             title (str): 파일 제목 (선택사항)
             initial_comment (str): 파일과 함께 보낼 코멘트 (선택사항)
             filetype (Optional[str]): 파일 타입 (선택사항, 자동 감지됨)
+            dedupe (bool): 같은 내용의 기존 업로드를 재사용할지 여부 (기본값: True)
         
         Returns:
             Dict[str, Any]: API 응답 결과
@@ -579,6 +3499,16 @@ class SlackAPIClient:
             file_size: int = os.path.getsize(file_path)
             filename: str = os.path.basename(file_path)
             
+            # 같은 내용의 파일이 이미 업로드되어 있으면 참조로 공유
+            digest: str = ""
+            if dedupe:
+                digest = self._file_digest(file_path)
+                shared_result: Optional[Dict[str, Any]] = self._share_cached_upload(
+                    digest, channels, title, initial_comment
+                )
+                if shared_result is not None:
+                    return shared_result
+            
             # 파일 타입 자동 감지
             if not filetype:
                 guessed_type, _ = mimetypes.guess_type(file_path)
@@ -606,9 +3536,20 @@ class SlackAPIClient:
             upload_url: str = upload_url_result.get("upload_url", "")
             file_id: str = upload_url_result.get("file_id", "")
             
+            upload_timeout: Optional[float] = self.request_timeout()
+            if upload_timeout is None:
+                return {
+                    "success": False,
+                    "error": "도구 호출 마감 시간이 지나 파일을 업로드하지 않았습니다."
+                }
+            
             # 2단계: 파일 업로드
             with open(file_path, 'rb') as file_content:
-                upload_response: requests.Response = requests.post(upload_url, files={'file': file_content})
+                upload_response: requests.Response = requests.post(
+                    upload_url, 
+                    files={'file': file_content}, 
+                    timeout=upload_timeout
+                )
                 
                 if upload_response.status_code != 200:
                     return {
@@ -631,6 +3572,19 @@ class SlackAPIClient:
             )
             
             if complete_result.get("ok"):
+                uploaded_files: List[Dict[str, Any]] = complete_result.get("files", [])
+                permalink: str = uploaded_files[0].get("permalink", "") if uploaded_files else ""
+                
+                if digest and permalink:
+                    with self._directory_lock:
+                        self._upload_cache[digest] = {
+                            "file_id": file_id,
+                            "permalink": permalink,
+                            "filename": filename,
+                            "file_size": file_size
+                        }
+                        self._snapshot_dirty = True
+                
                 return {
                     "success": True,
                     "message": "파일이 성공적으로 업로드되었습니다. (새로운 API)",
@@ -5,12 +5,17 @@ FastMCP를 사용하여 Slack API와 연동되는 MCP 서버를 구현합니다.
 완전한 타입 힌트와 typing 모듈을 적용한 버전입니다.
 """
 
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable, TypeVar, Awaitable
+import asyncio
 import base64
 import tempfile
+import functools
+import threading
+import time
 import os
+from concurrent.futures import ThreadPoolExecutor, Future
 from fastmcp import FastMCP
-from slack_api import SlackAPIClient
+from slack_api import SlackAPIClient, LatencyTracker
 
 # FastMCP 앱 생성
 mcp: FastMCP = FastMCP("🐸 Pepe Bot Slack MCP Server v1.02")
@@ -18,9 +23,290 @@ mcp: FastMCP = FastMCP("🐸 Pepe Bot Slack MCP Server v1.02")
 # Slack API 클라이언트 인스턴스 생성
 slack_client: SlackAPIClient = SlackAPIClient()
 
+# 도구 호출 마감 시간 (초) - 대기열 대기 시간을 포함하며, 도구 안의 모든 Slack HTTP 요청에 전파됩니다
+TOOL_DEADLINE_SECONDS: float = float(os.getenv("SLACK_TOOL_DEADLINE", "60"))
+UPLOAD_TOOL_DEADLINE_SECONDS: float = float(os.getenv("SLACK_UPLOAD_TOOL_DEADLINE", "300"))
+
+# 전체 디렉토리 조회 도구의 마감 시간 (초) - users.list/conversations.list는 Tier 2라
+# 5만 명 규모 워크스페이스(1000명씩 50페이지)를 조회하는 데 2분 이상 걸립니다
+DIRECTORY_TOOL_DEADLINE_SECONDS: float = float(os.getenv("SLACK_DIRECTORY_TOOL_DEADLINE", "300"))
+
+# 도구 종류별 워커 수와 최대 대기열 길이 (실행 중 + 대기 중)
+TOOL_POOLS: Dict[str, Dict[str, int]] = {
+    "light": {
+        "workers": int(os.getenv("SLACK_LIGHT_WORKERS", "8")),
+        "max_queue": int(os.getenv("SLACK_LIGHT_MAX_QUEUE", "64"))
+    },
+    "enrichment": {
+        "workers": int(os.getenv("SLACK_ENRICHMENT_WORKERS", "4")),
+        "max_queue": int(os.getenv("SLACK_ENRICHMENT_MAX_QUEUE", "16"))
+    },
+    "upload": {
+        "workers": int(os.getenv("SLACK_UPLOAD_WORKERS", "2")),
+        "max_queue": int(os.getenv("SLACK_UPLOAD_MAX_QUEUE", "4"))
+    }
+}
+
+# 도구 함수는 결과 dict 또는 (아웃박스 전송처럼) 나중에 결과가 채워질 Future를 반환
+ToolFunction = TypeVar("ToolFunction", bound=Callable[..., Union[Dict[str, Any], "Future[Dict[str, Any]]"]])
+
+
+class ToolPool:
+    """
+    도구 종류 하나의 워커 풀과 대기열 상태
+    """
+    
+    def __init__(self, name: str, workers: int, max_queue: int) -> None:
+        """
+        ToolPool을 초기화합니다.
+        
+        Args:
+            name (str): 도구 종류 이름
+            workers (int): 워커 스레드 수
+            max_queue (int): 실행 중 + 대기 중 호출의 최대 수 (넘으면 즉시 거부)
+        """
+        self.name: str = name
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, 
+            thread_name_prefix=f"tool-{name}"
+        )
+        self.in_flight: int = 0
+        self.running: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+        self.queue_wait: LatencyTracker = LatencyTracker(min_samples=1)
+        self.run_time: LatencyTracker = LatencyTracker(min_samples=1)
+        self.lock: threading.Lock = threading.Lock()
+    
+    def admit(self) -> bool:
+        """
+        대기열에 자리가 있으면 호출을 받아들입니다.
+        
+        Returns:
+            bool: 수락 여부
+        """
+        with self.lock:
+            if self.in_flight >= self.max_queue:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+    
+    def release(self) -> None:
+        """
+        워커 실행이 끝났거나 실행 전에 취소된 호출을 대기열에서 뺍니다.
+        """
+        with self.lock:
+            self.in_flight -= 1
+            self.completed += 1
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        풀의 대기열 상태와 대기/실행 시간 백분위수를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: 워커 수, 대기열 길이, 거부 수, 대기/실행 시간 p50/p99 (ms)
+        """
+        def ms(tracker: LatencyTracker, percentile: float) -> Optional[float]:
+            value: Optional[float] = tracker.percentile(percentile)
+            return round(value * 1000, 1) if value is not None else None
+        
+        with self.lock:
+            in_flight, running = self.in_flight, self.running
+            completed, rejected = self.completed, self.rejected
+        
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": running,
+            "queued": in_flight - running,
+            "completed": completed,
+            "rejected": rejected,
+            "queue_wait_p50_ms": ms(self.queue_wait, 50),
+            "queue_wait_p99_ms": ms(self.queue_wait, 99),
+            "run_time_p50_ms": ms(self.run_time, 50),
+            "run_time_p99_ms": ms(self.run_time, 99)
+        }
+
+
+class ToolScheduler:
+    """
+    도구 종류별(가벼운 I/O, 조회·집계, 업로드) 워커 풀로 도구 실행을 나누는 스케줄러
+    
+    대기열이 가득 차면 즉시 거부하여 메모리를 보호하고, 도구별 동시 실행 수도 제한합니다.
+    """
+    
+    def __init__(self, pools: Dict[str, Dict[str, int]]) -> None:
+        """
+        ToolScheduler를 초기화합니다.
+        
+        Args:
+            pools (Dict[str, Dict[str, int]]): 도구 종류별 {"workers": ..., "max_queue": ...}
+        """
+        self.pools: Dict[str, ToolPool] = {
+            name: ToolPool(name, config["workers"], config["max_queue"]) 
+            for name, config in pools.items()
+        }
+        self._tool_limits: Dict[str, asyncio.Semaphore] = {}
+    
+    async def run(
+        self, 
+        tool_name: str, 
+        pool_name: str, 
+        deadline_seconds: float, 
+        max_concurrency: Optional[int], 
+        call: Callable[[], Union[Dict[str, Any], Future]]
+    ) -> Dict[str, Any]:
+        """
+        도구 호출을 해당 종류의 워커 풀에서 실행합니다.
+        
+        Args:
+            tool_name (str): 도구 이름
+            pool_name (str): 도구 종류 ("light", "enrichment", "upload")
+            deadline_seconds (float): 대기 시간을 포함한 호출 마감 시간 (초)
+            max_concurrency (Optional[int]): 이 도구의 최대 동시 실행 수
+            call (Callable[[], Union[Dict[str, Any], Future]]): 실행할 도구 함수
+        
+        Returns:
+            Dict[str, Any]: 도구 실행 결과 또는 거부 응답
+        """
+        pool: ToolPool = self.pools[pool_name]
+        if not pool.admit():
+            return {
+                "success": False,
+                "error": "server_busy",
+                "message": f"{pool_name} 작업 대기열이 가득 찼습니다 ({pool.max_queue}건). 잠시 후 다시 시도하세요."
+            }
+        
+        enqueued_at: float = time.monotonic()
+        limit: Optional[asyncio.Semaphore] = None
+        if max_concurrency is not None:
+            limit = self._tool_limits.setdefault(tool_name, asyncio.Semaphore(max_concurrency))
+            try:
+                await limit.acquire()
+            except BaseException:
+                pool.release()
+                raise
+        
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        
+        def finished(_: Future) -> None:
+            # 요청이 취소되어도 워커 스레드의 실행이 실제로 끝난 뒤에만 자리를 반납
+            pool.release()
+            if limit is not None:
+                loop.call_soon_threadsafe(limit.release)
+        
+        try:
+            future: Future = pool.executor.submit(self._execute, pool, enqueued_at, deadline_seconds, call)
+        except BaseException:
+            pool.release()
+            if limit is not None:
+                limit.release()
+            raise
+        
+        future.add_done_callback(finished)
+        result: Union[Dict[str, Any], Future] = await asyncio.wrap_future(future)
+        
+        # 아웃박스 병합 전송은 워커를 반납한 뒤 이벤트 루프에서 결과를 기다림
+        if isinstance(result, Future):
+            return await asyncio.wrap_future(result)
+        return result
+    
+    @staticmethod
+    def _execute(
+        pool: ToolPool, 
+        enqueued_at: float, 
+        deadline_seconds: float, 
+        call: Callable[[], Union[Dict[str, Any], Future]]
+    ) -> Union[Dict[str, Any], Future]:
+        """
+        워커 스레드에서 도구를 실행하고 대기/실행 시간을 기록합니다.
+        
+        Args:
+            pool (ToolPool): 실행 중인 풀
+            enqueued_at (float): 대기열에 들어온 시각 (time.monotonic)
+            deadline_seconds (float): 대기 시간을 포함한 호출 마감 시간 (초)
+            call (Callable[[], Union[Dict[str, Any], Future]]): 실행할 도구 함수
+        
+        Returns:
+            Union[Dict[str, Any], Future]: 도구 실행 결과 (또는 결과를 담을 Future)
+        """
+        started_at: float = time.monotonic()
+        queue_wait: float = started_at - enqueued_at
+        pool.queue_wait.record(queue_wait)
+        
+        remaining: float = deadline_seconds - queue_wait
+        if remaining <= 0:
+            return {
+                "success": False,
+                "error": "deadline_exceeded",
+                "message": "대기열에서 기다리는 동안 도구 호출 마감 시간이 지났습니다."
+            }
+        
+        with pool.lock:
+            pool.running += 1
+        try:
+            with slack_client.deadline(remaining):
+                return call()
+        finally:
+            pool.run_time.record(time.monotonic() - started_at)
+            with pool.lock:
+                pool.running -= 1
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        풀별 대기열/대기 시간 지표를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: 도구 종류별 지표
+        """
+        return {name: pool.metrics() for name, pool in self.pools.items()}
+
+
+tool_scheduler: ToolScheduler = ToolScheduler(TOOL_POOLS)
+
+
+def scheduled_tool(
+    pool_name: str, 
+    deadline: Optional[float] = None, 
+    max_concurrency: Optional[int] = None
+) -> Callable[[ToolFunction], Callable[..., Awaitable[Dict[str, Any]]]]:
+    """
+    동기 도구 함수를 지정한 종류의 워커 풀에서 실행하도록 감싸는 데코레이터입니다.
+    
+    Args:
+        pool_name (str): 도구 종류 ("light", "enrichment", "upload")
+        deadline (Optional[float]): 호출 마감 시간 (초, 기본값: 업로드는 300초, 나머지는 60초)
+        max_concurrency (Optional[int]): 이 도구의 최대 동시 실행 수 (기본값: 제한 없음)
+    
+    Returns:
+        Callable[[ToolFunction], Callable[..., Awaitable[Dict[str, Any]]]]: 데코레이터
+    """
+    if deadline is None:
+        deadline = UPLOAD_TOOL_DEADLINE_SECONDS if pool_name == "upload" else TOOL_DEADLINE_SECONDS
+    deadline_seconds: float = deadline
+    
+    def decorator(fn: ToolFunction) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            return await tool_scheduler.run(
+                fn.__name__, 
+                pool_name, 
+                deadline_seconds, 
+                max_concurrency, 
+                functools.partial(fn, *args, **kwargs)
+            )
+        # 도구 함수가 Future를 반환해도 MCP 도구 자체는 결과 dict를 반환
+        wrapper.__annotations__ = dict(fn.__annotations__, **{"return": Dict[str, Any]})
+        return wrapper
+    return decorator
+
 
 @mcp.tool()
-def send_slack_message(channel: str, text: str) -> Dict[str, Any]:
+@scheduled_tool("light")
+def send_slack_message(channel: str, text: str) -> "Future[Dict[str, Any]]":
     """
     지정된 Slack 채널에 메시지를 전송합니다.
     
@@ -31,10 +317,11 @@ def send_slack_message(channel: str, text: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: API 응답 결과
     """
-    return slack_client.send_message(channel, text)
+    return slack_client.queue_message(channel, text)
 
 
 @mcp.tool()
+@scheduled_tool("enrichment", deadline=DIRECTORY_TOOL_DEADLINE_SECONDS)
 def get_slack_channels() -> Dict[str, Any]:
     """
     접근 가능한 모든 Slack 채널 목록을 조회합니다.
@@ -46,6 +333,7 @@ def get_slack_channels() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@scheduled_tool("enrichment")
 def get_slack_channel_history(channel_id: str, limit: int = 10) -> Dict[str, Any]:
     """
     지정된 채널의 최근 메시지 히스토리를 조회합니다.
@@ -61,28 +349,56 @@ def get_slack_channel_history(channel_id: str, limit: int = 10) -> Dict[str, Any
 
 
 @mcp.tool()
-def send_slack_direct_message(user_id: str, text: str) -> Dict[str, Any]:
+@scheduled_tool("enrichment", deadline=UPLOAD_TOOL_DEADLINE_SECONDS, max_concurrency=2)
+def analyze_slack_channel_activity(channel_id: str, oldest: str = "", latest: str = "", 
+                                   utc_offset_hours: float = 0.0, top_n: int = 10, 
+                                   incremental: bool = True) -> Dict[str, Any]:
+    """
+    채널 히스토리를 서버에서 집계하여 활동 통계만 반환합니다.
+    "이번 달 #x에서 누가 가장 활발한가", "메시지량 추이" 같은 질문에 사용하세요.
+    같은 조건으로 다시 호출하면 마지막 집계 이후의 새 메시지만 조회합니다.
+    
+    Args:
+        channel_id (str): 분석할 채널의 ID 또는 채널명 (예: C1234567890, #general)
+        oldest (str): 시작 시점 (Slack ts 또는 "YYYY-MM-DD", 기본값: 전체)
+        latest (str): 끝 시점 (Slack ts 또는 "YYYY-MM-DD", 기본값: 현재)
+        utc_offset_hours (float): 시간대 히스토그램의 UTC 오프셋 (예: KST는 9)
+        top_n (int): 상위 사용자/반응자/이모지 수 (기본값: 10)
+        incremental (bool): 저장된 워터마크부터 증분 계산할지 여부 (기본값: True)
+    
+    Returns:
+        Dict[str, Any]: 사용자별 메시지 수, 시간대/요일/일별 히스토그램, 스레드 비율, 상위 반응자
+    """
+    return slack_client.analyze_channel_activity(
+        channel_id, oldest, latest, utc_offset_hours, top_n, incremental
+    )
+
+
+@mcp.tool()
+@scheduled_tool("light")
+def send_slack_direct_message(user_id: str, text: str) -> "Future[Dict[str, Any]]":
     """
     특정 사용자에게 1:1 다이렉트 메시지를 전송합니다.
     
     Args:
-        user_id (str): 메시지를 받을 사용자의 ID
+        user_id (str): 메시지를 받을 사용자의 ID 또는 이름 (예: U0123456789, @pepe, 이메일)
         text (str): 전송할 메시지 내용
     
     Returns:
         Dict[str, Any]: API 응답 결과
     """
-    return slack_client.send_direct_message(user_id, text)
+    return slack_client.queue_direct_message(user_id, text)
 
 
 @mcp.tool()
+@scheduled_tool("light")
 def invite_user_to_channel(channel_id: str, user_id: str) -> Dict[str, Any]:
     """
     지정된 채널에 사용자를 초대합니다.
     
     Args:
-        channel_id (str): 초대할 채널의 ID
-        user_id (str): 초대할 사용자의 ID
+        channel_id (str): 초대할 채널의 ID 또는 채널명 (예: C1234567890, #general)
+        user_id (str): 초대할 사용자의 ID 또는 이름 (예: U0123456789, @pepe, 이메일)
     
     Returns:
         Dict[str, Any]: API 응답 결과
@@ -91,6 +407,24 @@ def invite_user_to_channel(channel_id: str, user_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@scheduled_tool("enrichment")
+def invite_users_to_channels(channel_ids: str, user_ids: str) -> Dict[str, Any]:
+    """
+    여러 사용자를 여러 채널에 한 번에 초대합니다.
+    이미 채널에 있는 사용자는 건너뛰고, 사용자별 실패 사유를 함께 반환합니다.
+    
+    Args:
+        channel_ids (str): 초대할 채널 ID 또는 채널명 목록 (쉼표로 구분, 예: "C123,#general")
+        user_ids (str): 초대할 사용자 ID 또는 이름 목록 (쉼표로 구분, 예: "U123,@pepe")
+    
+    Returns:
+        Dict[str, Any]: 채널별 초대/건너뜀/실패 사용자 결과
+    """
+    return slack_client.invite_users_to_channels(channel_ids.split(","), user_ids.split(","))
+
+
+@mcp.tool()
+@scheduled_tool("enrichment", deadline=DIRECTORY_TOOL_DEADLINE_SECONDS)
 def get_slack_users() -> Dict[str, Any]:
     """
     워크스페이스의 모든 사용자 목록을 조회합니다.
@@ -102,21 +436,76 @@ def get_slack_users() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def add_reaction_to_message(channel_id: str, timestamp: str) -> Dict[str, Any]:
+@scheduled_tool("enrichment", deadline=DIRECTORY_TOOL_DEADLINE_SECONDS, max_concurrency=1)
+def refresh_slack_directory(mode: str = "delta") -> Dict[str, Any]:
+    """
+    사용자/채널 디렉토리 캐시를 새로 고치고 변경 내역을 반환합니다.
+    delta 모드는 지난 동기화 이후 추가/변경/삭제된 항목만 캐시와 인덱스에 반영합니다.
+    
+    Args:
+        mode (str): "delta" (증분 반영) 또는 "full" (전체 재구성) 기본값: "delta"
+    
+    Returns:
+        Dict[str, Any]: 사용자/채널별 added, modified, removed 변경 내역 (처음 불러온 경우 baseline: true와 전체 개수만)
+    """
+    return slack_client.refresh_directory(mode)
+
+
+@mcp.tool()
+@scheduled_tool("light")
+def resolve_slack_entities(queries: List[str], entity_type: Optional[str] = None, limit: int = 5) -> Dict[str, Any]:
+    """
+    이름, 실명, 표시 이름, 이메일로 사용자/채널 ID를 찾습니다.
+    전체 디렉토리를 내려받지 않고 캐시된 인덱스에서 정확/접두사/유사 일치로 검색합니다.
+    
+    Args:
+        queries (List[str]): 검색어 목록 (예: ["#general", "@pepe", "pepe@example.com"])
+        entity_type (Optional[str]): "user" 또는 "channel"로 제한 (기본값: 전체)
+        limit (int): 검색어별 최대 결과 수 (기본값: 5)
+    
+    Returns:
+        Dict[str, Any]: 검색어별 후보 목록 (ID, 이름, match_type, score)
+    """
+    return slack_client.resolve_entities(queries, entity_type, limit)
+
+
+@mcp.tool()
+@scheduled_tool("light")
+def add_reaction_to_message(channel_id: str, timestamp: str, emoji: str = "jammies-frog") -> Dict[str, Any]:
     """
-    특정 메시지에 jammies-frog 🐸 이모지 반응을 추가합니다.
+    특정 메시지에 이모지 반응을 추가합니다 (기본값: jammies-frog 🐸).
     
     Args:
         channel_id (str): 메시지가 있는 채널의 ID
         timestamp (str): 메시지의 타임스탬프 (ts)
+        emoji (str): 추가할 이모지 이름 (기본값: "jammies-frog")
     
     Returns:
         Dict[str, Any]: API 응답 결과
     """
-    return slack_client.add_reaction(channel_id, timestamp)
+    return slack_client.add_reaction(channel_id, timestamp, emoji)
 
 
 @mcp.tool()
+@scheduled_tool("enrichment")
+def add_reactions_to_messages(reactions: List[Dict[str, str]], emoji: str = "jammies-frog") -> Dict[str, Any]:
+    """
+    여러 메시지에 이모지 반응을 한 번에 추가합니다.
+    속도 제한(Tier 3)을 지키며 병렬로 처리하고, 이미 달린 반응은 성공으로 간주합니다.
+    
+    Args:
+        reactions (List[Dict[str, str]]): 반응을 추가할 메시지 목록
+            (각 항목: {"channel_id": "C...", "timestamp": "...", "emoji": "선택"})
+        emoji (str): 항목에 emoji가 없을 때 사용할 이모지 (기본값: "jammies-frog")
+    
+    Returns:
+        Dict[str, Any]: 항목별 결과와 성공/실패 집계
+    """
+    return slack_client.add_reactions_bulk(reactions, emoji)
+
+
+@mcp.tool()
+@scheduled_tool("enrichment")
 def search_slack_messages(query: str, sort: str = "timestamp", count: int = 20) -> Dict[str, Any]:
     """
     키워드를 통해 워크스페이스의 메시지를 검색합니다.
@@ -134,6 +523,28 @@ def search_slack_messages(query: str, sort: str = "timestamp", count: int = 20)
 
 
 @mcp.tool()
+@scheduled_tool("enrichment", max_concurrency=2)
+def search_slack_messages_multi(queries: List[str], sort: str = "timestamp", 
+                                pages_per_query: int = 1, count: int = 100) -> Dict[str, Any]:
+    """
+    여러 검색어와 여러 페이지를 한 번에 병렬로 검색합니다.
+    같은 메시지는 하나로 합치고, 점수 또는 시간순으로 정렬하여 반환합니다.
+    ⚠️ 이 기능은 User Token (SLACK_USER_TOKEN)과 search:read 권한이 필요합니다.
+    
+    Args:
+        queries (List[str]): 검색어 목록 (예: ["deploy 실패", "in:#ops rollback"])
+        sort (str): 정렬 방식 ("timestamp", "score") 기본값: "timestamp"
+        pages_per_query (int): 검색어당 조회할 페이지 수 (기본값: 1, 최대: 20)
+        count (int): 페이지당 메시지 수 (기본값: 100, 최대: 100)
+    
+    Returns:
+        Dict[str, Any]: 검색어별 통계와 중복 제거된 검색 결과 (각 메시지에 일치한 검색어 포함)
+    """
+    return slack_client.search_messages_multi(queries, sort, pages_per_query, count)
+
+
+@mcp.tool()
+@scheduled_tool("upload")
 def upload_file_to_slack(channels: str, file_path: str, title: str = "", 
                         initial_comment: str = "", filetype: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -154,11 +565,14 @@ def upload_file_to_slack(channels: str, file_path: str, title: str = "",
 
 
 @mcp.tool()
+@scheduled_tool("upload")
 def upload_file_to_slack_new(channels: str, file_path: str, title: str = "", 
-                            initial_comment: str = "", filetype: Optional[str] = None) -> Dict[str, Any]:
+                            initial_comment: str = "", filetype: Optional[str] = None,
+                            dedupe: bool = True) -> Dict[str, Any]:
     """
     새로운 Slack API를 사용하여 채널에 파일을 업로드합니다.
     (files.getUploadURLExternal + files.completeUploadExternal)
+    같은 내용의 파일이 이미 업로드되어 있으면 기존 파일 링크를 공유합니다.
     
     Args:
         channels (str): 파일을 업로드할 채널 ID (쉼표로 구분하여 여러 채널 가능)
@@ -166,19 +580,23 @@ def upload_file_to_slack_new(channels: str, file_path: str, title: str = "",
         title (str): 파일 제목 (선택사항)
         initial_comment (str): 파일과 함께 보낼 코멘트 (선택사항)
         filetype (Optional[str]): 파일 타입 (선택사항, 자동 감지됨)
+        dedupe (bool): 같은 내용의 기존 업로드를 재사용할지 여부 (기본값: True)
     
     Returns:
         Dict[str, Any]: API 응답 결과
     """
-    return slack_client.upload_file_new(channels, file_path, title, initial_comment, filetype)
+    return slack_client.upload_file_new(channels, file_path, title, initial_comment, filetype, dedupe)
 
 
 @mcp.tool()
+@scheduled_tool("upload")
 def upload_file_from_base64(channels: str, file_data: str, filename: str, 
-                           title: str = "", initial_comment: str = "") -> Dict[str, Any]:
+                           title: str = "", initial_comment: str = "",
+                           dedupe: bool = True) -> Dict[str, Any]:
     """
     Base64로 인코딩된 파일 데이터를 받아서 Slack에 업로드합니다.
     Inspector에서 파일 내용을 직접 입력할 때 유용합니다.
+    같은 내용의 파일이 이미 업로드되어 있으면 기존 파일 링크를 공유합니다.
     
     Args:
         channels (str): 파일을 업로드할 채널 ID
@@ -186,6 +604,7 @@ def upload_file_from_base64(channels: str, file_data: str, filename: str,
         filename (str): 파일명 (확장자 포함)
         title (str): 파일 제목 (선택사항)
         initial_comment (str): 파일과 함께 보낼 코멘트 (선택사항)
+        dedupe (bool): 같은 내용의 기존 업로드를 재사용할지 여부 (기본값: True)
     
     Returns:
         Dict[str, Any]: API 응답 결과
@@ -206,7 +625,7 @@ def upload_file_from_base64(channels: str, file_data: str, filename: str,
         try:
             # 새로운 API로 파일 업로드
             result: Dict[str, Any] = slack_client.upload_file_new(
-                channels, temp_file_path, title, initial_comment
+                channels, temp_file_path, title, initial_comment, dedupe=dedupe
             )
             return result
         finally:
@@ -222,6 +641,25 @@ def upload_file_from_base64(channels: str, file_data: str, filename: str,
 
 
 @mcp.tool()
+@scheduled_tool("upload")
+def download_slack_file(file_id: str, dest_path: str = "", preview_bytes: int = 0) -> Dict[str, Any]:
+    """
+    Slack에 첨부된 파일을 로컬 디스크로 내려받습니다.
+    중간에 끊긴 다운로드는 이어받고, 한 번 받은 파일은 로컬 캐시에서 바로 제공합니다.
+    
+    Args:
+        file_id (str): 내려받을 Slack 파일 ID (예: F0123456789)
+        dest_path (str): 복사할 경로 (선택사항, 비우면 캐시 경로만 반환)
+        preview_bytes (int): 결과에 포함할 파일 앞부분 텍스트 바이트 수 (예: 로그 확인 시 4000)
+    
+    Returns:
+        Dict[str, Any]: 로컬 경로, 크기, SHA-256 해시, 캐시 적중 여부, 미리보기
+    """
+    return slack_client.download_file(file_id, dest_path, preview_bytes)
+
+
+@mcp.tool()
+@scheduled_tool("light")
 def send_pepe_message_with_reaction(user_id: str, message: str) -> Dict[str, Any]:
     """
     🐸 Pepe Bot 전용 기능: 사용자에게 DM을 보내고 자동으로 jammies-frog 반응을 추가합니다.
@@ -246,7 +684,8 @@ def send_pepe_message_with_reaction(user_id: str, message: str) -> Dict[str, Any
     full_message: str = f"🐸 {message}\n{pepe_art}"
     
     # DM 전송
-    dm_result: Dict[str, Any] = slack_client.send_direct_message(user_id, full_message)
+    # 반응을 달 메시지 타임스탬프가 필요하므로 병합하지 않고 바로 전송 (워커도 붙잡지 않음)
+    dm_result: Dict[str, Any] = slack_client.send_direct_message(user_id, full_message, coalesce=False)
     
     if not dm_result.get("success"):
         return dm_result
@@ -256,8 +695,11 @@ def send_pepe_message_with_reaction(user_id: str, message: str) -> Dict[str, Any
     channel_id: Optional[str] = dm_result.get("channel")
     
     if timestamp and channel_id:
-        # jammies-frog 반응 추가
-        reaction_result: Dict[str, Any] = slack_client.add_reaction(channel_id, timestamp)
+        # jammies-frog 반응 추가 (일괄 반응 파이프라인 사용)
+        bulk_result: Dict[str, Any] = slack_client.add_reactions_bulk([
+            {"channel_id": channel_id, "timestamp": timestamp}
+        ])
+        reaction_result: Dict[str, Any] = bulk_result["results"][0]
         
         return {
             "success": True,
@@ -273,12 +715,27 @@ def send_pepe_message_with_reaction(user_id: str, message: str) -> Dict[str, Any
         }
 
 
+@mcp.tool()
+def get_slack_server_metrics() -> Dict[str, Any]:
+    """
+    서버 상태 지표를 조회합니다.
+    도구 종류별 대기열 길이/거부 수/대기 시간과, Slack API 엔드포인트별
+    회로 차단기 상태, p50/p99 응답 시간, 헤지 요청 통계를 포함합니다.
+    
+    Returns:
+        Dict[str, Any]: 도구 스케줄러 지표와 엔드포인트별 상태
+    """
+    metrics: Dict[str, Any] = slack_client.get_endpoint_health()
+    metrics["tool_pools"] = tool_scheduler.metrics()
+    return metrics
+
+
 def main() -> None:
     """
     MCP 서버를 실행합니다.
     """
     print("🐸 Pepe Bot Slack MCP Server v1.02 starting...")
-    print("📡 12개의 완전한 타입 힌트 적용 MCP 도구 준비 완료!")
+    print("📡 20개의 완전한 타입 힌트 적용 MCP 도구 준비 완료!")
     mcp.run()
 
 